@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""Benchmark suite for the libs and demo_sub_app public APIs.
+
+This script times calculate_sum, process_text, validate_input,
+set_logger_w_obj_name, production logging setup and disabled DEBUG log
+calls (eager f-strings vs lazy arguments) over input sizes from
+10 to 10^8, saves the results as a JSON baseline and compares later runs
+with it, failing when a benchmark got slower than the allowed threshold.
+
+Each benchmark builds its input once per size, then times the call with
+automatic loop calibration (like ``timeit``) and keeps the best of several
+runs. Sizes above a benchmark's own limit are skipped, so the largest
+inputs only run for the operations that can handle them in memory.
+
+Features:
+    - Input sizes on a 10x grid from 10 to 10^8, capped by --max-size
+    - Best-of-N timing with garbage collection disabled
+    - JSON baselines with interpreter and platform metadata
+    - Regression check with a relative threshold
+
+Usage:
+    python check_benchmarks.py [--save] [--max-size N] [--repeat N] [--threshold F]
+                               [--baseline PATH] [--filter TEXT] [--verbose]
+
+Examples:
+    python check_benchmarks.py --save              # Record a baseline (sizes up to 10^6)
+    python check_benchmarks.py                     # Compare with it, exit 1 on regression or no baseline
+    python check_benchmarks.py --max-size 1e8 --repeat 3 --save   # Full size range
+    python check_benchmarks.py --filter calculate_sum --threshold 0.1
+"""
+
+import contextlib
+import gc
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# Configure module-level logger
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+SRC_DIR = Path(__file__).resolve().parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / ".cache" / "benchmark_baseline.json"
+
+# Input sizes, from 10 to 10^8
+SIZES = [10 ** exponent for exponent in range(1, 9)]
+DEFAULT_MAX_SIZE = 10 ** 6
+
+# Relative slowdown reported as a regression (0.25 = 25% slower than the baseline)
+DEFAULT_THRESHOLD = 0.25
+
+# Minimum seconds per timed run; fast calls are looped until they take this long
+MIN_RUN_TIME = 0.2
+
+def _bench_calculate_sum_list(size: int) -> Callable[[], object]:
+    from libs.example_module1 import calculate_sum
+    numbers = [float(i) for i in range(size)]
+    return lambda: calculate_sum(numbers)
+
+def _bench_calculate_sum_ndarray(size: int) -> Callable[[], object]:
+    import numpy as np
+
+    from libs.example_module1 import calculate_sum
+    numbers = np.random.default_rng(0).random(size)
+    return lambda: calculate_sum(numbers)
+
+def _bench_calculate_sum_stream(size: int) -> Callable[[], object]:
+    from libs.example_module1 import calculate_sum
+    return lambda: calculate_sum(i * 0.5 for i in range(size))
+
+def _bench_process_text(size: int) -> Callable[[], object]:
+    from demo_sub_app.example_module2 import process_text
+    text = ("lorem ipsum dolor sit amet " * (size // 27 + 1))[:size]
+    return lambda: process_text(text, include_text=False)
+
+def _bench_validate_input(size: int) -> Callable[[], object]:
+    from demo_sub_app.example_module2 import validate_input
+    value = "x" * size
+    return lambda: validate_input(value, min_length=size // 2)
+
+def _bench_set_logger_w_obj_name(size: int) -> Callable[[], object]:
+    from libs.logging_utils import set_logger_w_obj_name
+
+    def resolve_loggers():
+        for _ in range(size):
+            set_logger_w_obj_name()
+    return resolve_loggers
+
+def _logging_bench(size: int, **options) -> Callable[[], object]:
+    from libs.logging_utils import setup_production_logging, shutdown_async_logging
+    bench_logger = logging.getLogger("benchmark.logging")
+
+    def setup_and_log():
+        # The console handler binds sys.stdout when it is created
+        with tempfile.TemporaryDirectory() as tmp_dir, open(os.devnull, "w") as devnull, \
+                contextlib.redirect_stdout(devnull):
+            setup_production_logging(Path(tmp_dir) / "bench.log", **options)
+            for i in range(size):
+                bench_logger.info("Benchmark record %d", i)
+            shutdown_async_logging()
+            _quiet_logging()
+    return setup_and_log
+
+def _disabled_debug_log_bench(size: int, eager: bool) -> Callable[[], object]:
+    """Log validate_input-style DEBUG lines with DEBUG off: f-strings vs %-style arguments."""
+    bench_logger = logging.getLogger("benchmark.debug_off")
+    payload = "x" * size
+
+    def eager_log():
+        # Deliberately eager: the f-strings are built although DEBUG is disabled
+        bench_logger.debug(f"Generated result: {payload[:100]}...")
+        bench_logger.debug(f"Validating input: type={type(payload).__name__}, "
+                           f"length={len(payload) if isinstance(payload, str) else 'N/A'}, min_length={1}")
+
+    def lazy_log():
+        bench_logger.debug("Generated result: %.100s...", payload)
+        if bench_logger.isEnabledFor(logging.DEBUG):
+            bench_logger.debug("Validating input: type=%s, length=%s, min_length=%s",
+                               type(payload).__name__, len(payload) if isinstance(payload, str) else 'N/A', 1)
+    return eager_log if eager else lazy_log
+
+# (name, largest size, factory returning a zero-argument callable for a size)
+BENCHMARKS: List[Tuple[str, int, Callable[[int], Callable[[], object]]]] = [
+    ("calculate_sum[list]", 10 ** 7, _bench_calculate_sum_list),
+    ("calculate_sum[ndarray]", 10 ** 8, _bench_calculate_sum_ndarray),
+    ("calculate_sum[stream]", 10 ** 7, _bench_calculate_sum_stream),
+    ("process_text", 10 ** 8, _bench_process_text),
+    ("validate_input", 10 ** 8, _bench_validate_input),
+    ("set_logger_w_obj_name", 10 ** 7, _bench_set_logger_w_obj_name),
+    ("setup_production_logging[text]", 10 ** 6, lambda size: _logging_bench(size)),
+    ("setup_production_logging[json]", 10 ** 6, lambda size: _logging_bench(size, output_format="json")),
+    ("setup_production_logging[async]", 10 ** 6, lambda size: _logging_bench(size, async_mode=True)),
+    ("debug_log_disabled[eager]", 10 ** 6, lambda size: _disabled_debug_log_bench(size, eager=True)),
+    ("debug_log_disabled[lazy]", 10 ** 6, lambda size: _disabled_debug_log_bench(size, eager=False)),
+]
+
+def _quiet_logging() -> None:
+    """Route library log calls nowhere, so benchmarks time the code rather than console output."""
+    logging.basicConfig(level=logging.WARNING, handlers=[logging.NullHandler()], force=True)
+
+def time_call(func: Callable[[], object], repeat: int) -> Tuple[float, int]:
+    """Return (best seconds per call, loops per run) over repeat timed runs."""
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        func()
+        first = time.perf_counter() - start
+        loops = max(1, int(MIN_RUN_TIME / first)) if first > 0 else 1000
+        best = first
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(loops):
+                func()
+            best = min(best, (time.perf_counter() - start) / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best, loops
+
+def environment() -> Dict[str, str]:
+    """Describe the interpreter and machine the results were measured on."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": str(os.cpu_count()),
+    }
+
+def run_benchmarks(max_size: int = DEFAULT_MAX_SIZE, repeat: int = 5, name_filter: str = "",
+                   verbose: bool = False) -> Dict[str, dict]:
+    """Run every selected benchmark at every size up to its limit and max_size.
+
+    Args:
+        max_size: Largest input size to run (default: DEFAULT_MAX_SIZE)
+        repeat: Timed runs per benchmark and size; the best one counts (default: 5)
+        name_filter: Only run benchmarks whose name contains this text (default: all)
+        verbose: Also print the loops per timed run (default: False)
+
+    Returns:
+        Results keyed by ``name[size=N]`` with seconds per call and loops per run
+    """
+    root = logging.getLogger()
+    saved_level, saved_handlers = root.level, list(root.handlers)
+    _quiet_logging()
+    results = {}
+    try:
+        for name, limit, factory in BENCHMARKS:
+            if name_filter not in name:
+                continue
+            for size in SIZES:
+                if size > min(limit, max_size):
+                    break
+                func = factory(size)
+                seconds, loops = time_call(func, repeat)
+                del func
+                key = f"{name}[size={size}]"
+                results[key] = {"seconds": seconds, "loops": loops}
+                detail = f"  ({loops} loops per run)" if verbose else ""
+                print(f"{key:50s} {seconds * 1e6:14.2f} us  {size / seconds:14.4g} items/s{detail}")
+    finally:
+        logging.basicConfig(level=saved_level, handlers=saved_handlers, force=True)
+    return results
+
+def load_baseline(path: Path) -> dict:
+    """Return the saved baseline, or an empty one if the file does not exist."""
+    if not path.exists():
+        return {"environment": {}, "results": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+def save_baseline(path: Path, results: Dict[str, dict]) -> None:
+    """Merge results into the baseline at path, replacing entries that were re-measured."""
+    baseline = load_baseline(path)
+    baseline["environment"] = environment()
+    baseline["saved_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+    baseline["results"].update(results)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+    print(f"Saved {len(results)} results to {path}")
+
+def compare_with_baseline(results: Dict[str, dict], baseline: dict, threshold: float) -> bool:
+    """Print the change of every result against the baseline.
+
+    Returns False on any regression, and also when no result has a baseline
+    entry, so a missing baseline (e.g. a fresh checkout in CI) fails the check
+    instead of passing it silently.
+    """
+    if baseline.get("environment") and baseline["environment"] != environment():
+        logger.warning("Baseline was measured on a different environment: %s", baseline["environment"])
+    previous = baseline.get("results", {})
+    passed = True
+    compared = 0
+    for key, result in results.items():
+        if key not in previous:
+            continue
+        compared += 1
+        ratio = result["seconds"] / previous[key]["seconds"]
+        regressed = ratio > 1 + threshold
+        passed &= not regressed
+        status = "FAIL" if regressed else "ok  "
+        print(f"{status}  {key:50s} {ratio:6.2f}x baseline")
+    if not compared:
+        logger.error("No results to compare; save a baseline with --save first")
+        return False
+    return passed
+
+def _option(args: List[str], flag: str, default: str) -> str:
+    return args[args.index(flag) + 1] if flag in args else default
+
+if __name__ == "__main__":
+    # Configure logging for script execution
+    logging.basicConfig(
+        level=logging.WARNING,  # Only show warnings and errors for CLI usage
+        format='%(levelname)s: %(message)s',
+        handlers=[logging.StreamHandler()],
+        force=True
+    )
+
+    args = sys.argv[1:]
+    if "--help" in args or "-h" in args:
+        print("Usage: python check_benchmarks.py [--save] [--max-size N] [--repeat N] [--threshold F]")
+        print("                                  [--baseline PATH] [--filter TEXT] [--verbose]")
+        print("  --save: Write the results to the baseline instead of comparing with it")
+        print(f"  --max-size N: Largest input size, up to 1e8 (default: {DEFAULT_MAX_SIZE:.0e})")
+        print("  --repeat N: Timed runs per benchmark and size, best one counts (default: 5)")
+        print(f"  --threshold F: Allowed relative slowdown (default: {DEFAULT_THRESHOLD})")
+        print(f"  --baseline PATH: Baseline JSON file (default: {DEFAULT_BASELINE})")
+        print("  --filter TEXT: Only run benchmarks whose name contains TEXT")
+        print("  --verbose: Show loops per run and detailed logging")
+        sys.exit(0)
+
+    verbose = "--verbose" in args
+    if verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+    baseline_path = Path(_option(args, "--baseline", str(DEFAULT_BASELINE)))
+    threshold = float(_option(args, "--threshold", str(DEFAULT_THRESHOLD)))
+    measured = run_benchmarks(max_size=int(float(_option(args, "--max-size", str(DEFAULT_MAX_SIZE)))),
+                              repeat=int(_option(args, "--repeat", "5")),
+                              name_filter=_option(args, "--filter", ""), verbose=verbose)
+
+    if "--save" in args:
+        save_baseline(baseline_path, measured)
+        sys.exit(0)
+    sys.exit(0 if compare_with_baseline(measured, load_baseline(baseline_path), threshold) else 1)
@@ -7,22 +7,29 @@ for configuration operations and error handling.
 
 Features:
     - TOML configuration file parsing
+    - Process-level cache, re-parsed only when the file changes
+    - Dotted key lookups such as ``documentation.build_strict``
     - GitHub Pages configuration validation
     - Verbose logging mode for debugging
     - Cross-platform Python version compatibility
 
 Usage:
-    python check_config.py [github_pages|show|--verbose]
+    python check_config.py [--config PATH] [github_pages|show|get KEY|--verbose]
 
 Examples:
     python check_config.py github_pages    # Check GitHub Pages status
     python check_config.py show           # Display full configuration
+    python check_config.py get documentation.build_strict  # Print one value
+    python check_config.py --config other.toml show        # Read another file
     python check_config.py --verbose      # Show detailed logging
 """
 
 import sys
+import copy
 import logging
+import os
 from pathlib import Path
+from typing import Any, Optional, Union
 
 # Configure module-level logger
 logger = logging.getLogger(__name__)
@@ -38,37 +45,109 @@ except ImportError:
         logger.critical("tomllib/tomli not available. Please install tomli for Python < 3.11")
         sys.exit(1)
 
-def read_config():
-    """Read project configuration from project.toml."""
-    config_path = Path("project.toml")
-    
-    if not config_path.exists():
-        logger.warning("project.toml not found, using defaults")
-        return {
-            "documentation": {
-                "github_pages_enabled": True,
-                "build_on_push": True,
-                "build_strict": True
-            },
-            "project": {
-                "auto_generate_api_docs": True,
-                "include_demo_apps": True
-            }
-        }
-    
+DEFAULT_CONFIG_PATH = Path("project.toml")
+
+# Configuration used when the file does not exist
+DEFAULT_CONFIG = {
+    "documentation": {
+        "github_pages_enabled": True,
+        "build_on_push": True,
+        "build_strict": True
+    },
+    "project": {
+        "auto_generate_api_docs": True,
+        "include_demo_apps": True
+    }
+}
+
+# Parsed configurations by absolute path, with the (mtime_ns, size) they were parsed at
+_config_cache: dict = {}
+
+# Returned by get() for missing keys when the caller needs to tell them apart from stored values
+_MISSING = object()
+
+def _file_signature(config_path: Path) -> Optional[tuple]:
+    """Return (mtime_ns, size) of the file, or None if it does not exist."""
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def _cached_config(config_path: Optional[Union[str, os.PathLike]]) -> dict:
+    """Return the cached configuration for a file, parsing it if it is new or has changed.
+
+    The returned dictionary is the one held in the cache and must not be
+    modified or handed to callers.
+    """
+    config_path = Path(config_path) if config_path is not None else DEFAULT_CONFIG_PATH
+    key = config_path.absolute()
+    signature = _file_signature(config_path)
+    cached = _config_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        logger.debug("Using cached configuration for %s", config_path)
+        return cached[1]
+
+    if signature is None:
+        logger.warning("%s not found, using defaults", config_path)
+        _config_cache[key] = (None, DEFAULT_CONFIG)
+        return DEFAULT_CONFIG
+
     try:
         with open(config_path, "rb") as f:
             config = tomllib.load(f)
-        logger.info(f"Successfully loaded configuration from {config_path}")
-        return config
+        logger.info("Successfully loaded configuration from %s", config_path)
     except Exception as e:
-        logger.error(f"Error reading project.toml: {e}")
+        logger.error("Error reading %s: %s", config_path, e)
         sys.exit(1)
+    _config_cache[key] = (signature, config)
+    return config
 
-def check_github_pages_enabled():
+def read_config(config_path: Optional[Union[str, os.PathLike]] = None) -> dict:
+    """Read project configuration from a TOML file.
+
+    Parsed files are cached per process and only re-parsed when their
+    modification time or size changes, so repeated calls cost one stat()
+    and a copy. Each call returns its own copy, so callers may modify it
+    without affecting each other or the cache.
+
+    Args:
+        config_path: Path to the TOML file (default: project.toml in the working directory)
+
+    Returns:
+        The parsed configuration, or a copy of DEFAULT_CONFIG if the file does not exist
+    """
+    return copy.deepcopy(_cached_config(config_path))
+
+def clear_config_cache() -> None:
+    """Forget all cached configurations, forcing the next read to parse the file."""
+    _config_cache.clear()
+
+def get(key_path: str, default: Any = None, config_path: Optional[Union[str, os.PathLike]] = None) -> Any:
+    """Look up a configuration value by dotted key path.
+
+    Args:
+        key_path: Dot-separated keys, e.g. "documentation.github_pages_enabled"
+        default: Value returned when any key along the path is missing
+        config_path: Path to the TOML file (default: project.toml)
+
+    Returns:
+        A copy of the value at key_path, or default
+
+    Example:
+        >>> get("documentation.build_strict", default=False)
+        True
+    """
+    value = _cached_config(config_path)
+    for key in key_path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return default
+        value = value[key]
+    return copy.deepcopy(value)
+
+def check_github_pages_enabled(config_path: Optional[Union[str, os.PathLike]] = None) -> bool:
     """Check if GitHub Pages deployment is enabled."""
-    config = read_config()
-    return config.get("documentation", {}).get("github_pages_enabled", True)
+    return get("documentation.github_pages_enabled", True, config_path)
 
 if __name__ == "__main__":
     # Configure logging for script execution
@@ -79,25 +158,36 @@ if __name__ == "__main__":
         force=True
     )
     
-    config = read_config()
+    args = sys.argv[1:]
+    config_path = None
+    if len(args) >= 2 and args[0] == "--config":
+        config_path, args = args[1], args[2:]
     
     # Check what user wants to know
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "github_pages":
-            enabled = check_github_pages_enabled()
+    if args:
+        if args[0] == "github_pages":
+            enabled = check_github_pages_enabled(config_path)
             print("true" if enabled else "false")  # Keep print for CLI output
-        elif sys.argv[1] == "show":
+        elif args[0] == "show":
+            import json
+            print(json.dumps(read_config(config_path), indent=2))  # Keep print for CLI output
+        elif args[0] == "get" and len(args) == 2:
             import json
-            print(json.dumps(config, indent=2))  # Keep print for CLI output
-        elif sys.argv[1] == "--verbose":
+            value = get(args[1], default=_MISSING, config_path=config_path)
+            if value is _MISSING:
+                logger.error("Key not found: %s", args[1])
+                sys.exit(1)
+            print(value if isinstance(value, str) else json.dumps(value))  # Keep print for CLI output
+        elif args[0] == "--verbose":
             # Enable verbose logging for debugging
             logging.getLogger().setLevel(logging.DEBUG)
             logger.info("Verbose mode enabled")
-            config = read_config()
             import json
-            print(json.dumps(config, indent=2))
+            print(json.dumps(read_config(config_path), indent=2))
     else:
-        print("Usage: python check_config.py [github_pages|show|--verbose]")
+        print("Usage: python check_config.py [--config PATH] [github_pages|show|get KEY|--verbose]")
+        print("  --config PATH: Read PATH instead of project.toml")
         print("  github_pages: Check if GitHub Pages is enabled")
         print("  show: Display full configuration")
+        print("  get KEY: Print one value by dotted key, e.g. documentation.build_strict")
         print("  --verbose: Show detailed logging and configuration")
\ No newline at end of file
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Import-time regression check for the libs and demo_sub_app packages.
+
+This script runs each import statement below in a fresh interpreter with
+``python -X importtime``, adds up the cumulative time of the modules the
+statement imported (modules loaded at interpreter startup are excluded)
+and compares the best of several runs with the statement's budget. It also
+fails when a module that should only load on first use, such as NumPy or a
+process pool, was imported.
+
+Features:
+    - Per-statement startup budgets in milliseconds
+    - Forbidden eager imports reported by name
+    - Best-of-N timing to absorb scheduler noise
+    - Verbose mode listing the slowest imported modules
+
+Usage:
+    python check_import_time.py [--runs N] [--verbose]
+
+Examples:
+    python check_import_time.py              # Check all budgets, exit 1 on regression
+    python check_import_time.py --runs 10    # More runs on a noisy machine
+    python check_import_time.py --verbose    # Show the slowest modules per statement
+"""
+
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Configure module-level logger
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+SRC_DIR = Path(__file__).resolve().parent / "src"
+
+# (statement, budget in ms, modules it must not import)
+IMPORT_BUDGETS = [
+    ("import libs", 5, ("libs.example_module1", "libs.logging_utils", "numpy")),
+    ("from libs import calculate_sum", 15, ("numpy", "concurrent.futures", "libs.logging_utils")),
+    ("from libs.logging_utils import setup_production_logging", 40, ("inspect", "gzip", "concurrent.futures")),
+    ("import demo_sub_app", 5, ("demo_sub_app.example_module2", "libs.logging_utils")),
+    ("from demo_sub_app import process_text", 60, ("numpy", "pandas", "concurrent.futures", "datetime")),
+]
+
+def run_importtime(statement: str) -> list:
+    """Run a statement under -X importtime and return (cumulative_us, depth, module) entries."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        raise RuntimeError(f"{statement!r} failed:\n{result.stderr}")
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        module = name[1:]
+        entries.append((int(cumulative), (len(module) - len(module.lstrip())) // 2, module.strip()))
+    return entries
+
+def measure(statement: str, startup: set) -> tuple:
+    """Return (milliseconds, imported modules) for one fresh run of statement."""
+    entries = [entry for entry in run_importtime(statement) if entry[2] not in startup]
+    total_us = sum(cumulative for cumulative, depth, _ in entries if depth == 0)
+    return total_us / 1000, entries
+
+def check_import_budgets(runs: int = 5, verbose: bool = False) -> bool:
+    """Check every statement in IMPORT_BUDGETS; returns True if all pass."""
+    startup = {module for _, _, module in run_importtime("pass")}
+    logger.info("Excluding %d modules imported at interpreter startup", len(startup))
+    all_passed = True
+    for statement, budget_ms, forbidden in IMPORT_BUDGETS:
+        timings = [measure(statement, startup) for _ in range(runs)]
+        best_ms, entries = min(timings, key=lambda timing: timing[0])
+        imported = {module for _, _, module in entries}
+        eager = sorted(module for module in forbidden
+                       if module in imported or any(name.startswith(module + ".") for name in imported))
+        passed = best_ms <= budget_ms and not eager
+        all_passed &= passed
+        print(f"{'PASS' if passed else 'FAIL'}  {best_ms:7.1f} ms / {budget_ms:3d} ms  {statement}")
+        if eager:
+            print(f"      eagerly imported: {', '.join(eager)}")
+        if verbose or not passed:
+            for cumulative, _, module in sorted(entries, reverse=True)[:5]:
+                print(f"      {cumulative / 1000:7.1f} ms  {module}")
+    return all_passed
+
+if __name__ == "__main__":
+    # Configure logging for script execution
+    logging.basicConfig(
+        level=logging.WARNING,  # Only show warnings and errors for CLI usage
+        format='%(levelname)s: %(message)s',
+        handlers=[logging.StreamHandler()],
+        force=True
+    )
+
+    if "--help" in sys.argv or "-h" in sys.argv:
+        print("Usage: python check_import_time.py [--runs N] [--verbose]")
+        print("  --runs N: Fresh interpreter runs per statement, best one counts (default: 5)")
+        print("  --verbose: Show the slowest imported modules per statement")
+        sys.exit(0)
+
+    verbose = "--verbose" in sys.argv
+    if verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+    runs = int(sys.argv[sys.argv.index("--runs") + 1]) if "--runs" in sys.argv else 5
+
+    sys.exit(0 if check_import_budgets(runs, verbose) else 1)
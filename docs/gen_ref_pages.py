@@ -2,87 +2,181 @@
 
 This script creates detailed API documentation for each module while preserving
 manual overview pages for better organization.
+
+Generation is incremental: a manifest in ``.cache/gen_ref_pages.json`` keeps
+a content hash and last-change time for every page. Unchanged sources are
+recognized by their stat() and never re-read, and every page keeps the
+modification time of its last real change, so ``mkdocs serve --dirty`` only
+re-renders pages whose module source or docstrings changed. Modules that no
+longer exist are pruned from the manifest and from the built site.
 """
 
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
 from pathlib import Path
+
 import mkdocs_gen_files
+from mkdocs.structure.files import File
+
+# Shown in the mkdocs build output
+logger = logging.getLogger("mkdocs.plugins.gen_ref_pages")
 
 # Define the source directory
 src_dir = Path("src")
 api_nav = []
 
+# Content hashes of the generated pages, kept between builds
+manifest_path = Path(".cache", "gen_ref_pages.json")
+MANIFEST_VERSION = 1
+
+def load_manifest() -> dict:
+    """Return the page entries of the previous build, or {} if there is no usable manifest."""
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("pages", {})
+
+def save_manifest(pages: dict) -> None:
+    """Write the manifest atomically, so an interrupted build never leaves it half-written."""
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = manifest_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps({"version": MANIFEST_VERSION, "pages": pages}, indent=1, sort_keys=True),
+                        encoding="utf-8")
+    os.replace(tmp_path, manifest_path)
+
+def write_page(doc_path: str, content: str, source_hash: str, previous: dict) -> dict:
+    """Emit a generated page, keeping its previous modification time when nothing changed."""
+    page_hash = hashlib.sha256(f"{source_hash}\0{content}".encode("utf-8")).hexdigest()
+    unchanged = previous.get("hash") == page_hash
+    changed_at = previous["changed_at"] if unchanged else time.time_ns()
+    with mkdocs_gen_files.open(doc_path, "w") as fd:
+        fd.write(content)
+    # mkdocs --dirty skips pages whose source is older than their built HTML
+    os.utime(fd.name, ns=(changed_at, changed_at))
+    if not unchanged:
+        logger.info("API reference updated: %s", doc_path)
+    return {"hash": page_hash, "changed_at": changed_at}
+
+def source_hash_for(path: Path, previous: dict) -> tuple:
+    """Return (stat signature, content hash) of a source file, re-reading it only if its stat changed."""
+    stat = path.stat()
+    signature = [stat.st_mtime_ns, stat.st_size]
+    if previous.get("source_stat") == signature and "source_hash" in previous:
+        return signature, previous["source_hash"]
+    return signature, hashlib.sha256(path.read_bytes()).hexdigest()
+
+def prune_built_page(doc_path: str) -> None:
+    """Remove the built HTML of a deleted module, which dirty builds would otherwise keep serving."""
+    config = mkdocs_gen_files.FilesEditor.current().config
+    built = Path(File(doc_path, src_dir=None, dest_dir=config["site_dir"],
+                      use_directory_urls=config["use_directory_urls"]).abs_dest_path)
+    if built.exists() and config["use_directory_urls"]:
+        shutil.rmtree(built.parent)
+    elif built.exists():
+        built.unlink()
+    logger.info("API reference pruned: %s", doc_path)
+
+previous_pages = load_manifest()
+pages = {}
+
 # Generate documentation for each Python package/module
 for path in sorted(src_dir.rglob("*.py")):
     # Skip __pycache__, __init__.py and other non-source files
     if "__pycache__" in str(path) or path.name.startswith("__"):
         continue
-    
+
     # Convert file path to module path
     module_path = path.relative_to(src_dir).with_suffix("")
     doc_path = path.relative_to(src_dir).with_suffix(".md")
     full_doc_path = Path("api", "reference") / doc_path
-    
+
     # Convert path separators to dots for Python module names
     module_name = str(module_path).replace("/", ".")
-    
+
     # Create the markdown content with mkdocstrings reference
-    with mkdocs_gen_files.open(full_doc_path, "w") as fd:
-        # Get the module/package name for the title
-        title = module_path.name or str(module_path)
-        
-        print(f"# {title.replace('_', ' ').title()}", file=fd)
-        print(f"", file=fd)
-        print(f"Auto-generated API documentation for `{module_name}`.", file=fd)
-        print(f"", file=fd)
-        print(f"::: src.{module_name}", file=fd)
-        print(f"    options:", file=fd)
-        print(f"      show_source: true", file=fd)
-        print(f"      show_root_heading: false", file=fd)
-        print(f"      show_signature_annotations: true", file=fd)
-        print(f"      separate_signature: true", file=fd)
-    
+    # Get the module/package name for the title
+    title = module_path.name or str(module_path)
+    content = "\n".join([
+        f"# {title.replace('_', ' ').title()}",
+        "",
+        f"Auto-generated API documentation for `{module_name}`.",
+        "",
+        f"::: src.{module_name}",
+        "    options:",
+        "      show_source: true",
+        "      show_root_heading: false",
+        "      show_signature_annotations: true",
+        "      separate_signature: true",
+        "",
+    ])
+
+    # The page must be re-rendered when the module changes, even though its stub text does not
+    key = full_doc_path.as_posix()
+    previous = previous_pages.get(key, {})
+    source_stat, source_hash = source_hash_for(path, previous)
+    pages[key] = dict(write_page(key, content, source_hash, previous),
+                      source_stat=source_stat, source_hash=source_hash)
+
     # Set up navigation
     mkdocs_gen_files.set_edit_path(full_doc_path, path)
-    
+
     # Build navigation structure
     api_nav.append(str(full_doc_path))
 
 # Create an index page for auto-generated API docs
-with mkdocs_gen_files.open("api/reference/index.md", "w") as fd:
-    print("# Auto-Generated API Reference", file=fd)
-    print("", file=fd)
-    print("This section contains automatically generated documentation for all modules.", file=fd)
-    print("For curated overviews and examples, see the main API Reference section.", file=fd)
-    print("", file=fd)
-    print("## Available Modules", file=fd)
-    print("", file=fd)
-    
-    # Group modules by package
-    modules_by_package = {}
-    for nav_path in sorted(api_nav):
-        parts = Path(nav_path).parts[2:]  # Remove 'api/reference'
-        if len(parts) > 1:
-            package = parts[0]
-            module = parts[1]
-            if package not in modules_by_package:
-                modules_by_package[package] = []
-            modules_by_package[package].append((module, nav_path))
-        else:
-            # Root level modules
-            module = parts[0]
-            if "root" not in modules_by_package:
-                modules_by_package["root"] = []
-            modules_by_package["root"].append((module, nav_path))
-    
-    for package, modules in modules_by_package.items():
-        if package == "root":
-            print("### Root Modules", file=fd)
-        else:
-            print(f"### {package.title()} Package", file=fd)
-        print("", file=fd)
-        
-        for module_file, nav_path in modules:
-            module_name = module_file.replace(".md", "").replace("_", " ").title()
-            link_path = nav_path.replace("api/reference/", "")
-            print(f"- **[{module_name}]({link_path})** - Detailed API documentation", file=fd)
-        print("", file=fd)
\ No newline at end of file
+index_lines = [
+    "# Auto-Generated API Reference",
+    "",
+    "This section contains automatically generated documentation for all modules.",
+    "For curated overviews and examples, see the main API Reference section.",
+    "",
+    "## Available Modules",
+    "",
+]
+
+# Group modules by package
+modules_by_package = {}
+for nav_path in sorted(api_nav):
+    parts = Path(nav_path).parts[2:]  # Remove 'api/reference'
+    if len(parts) > 1:
+        package = parts[0]
+        module = parts[1]
+        if package not in modules_by_package:
+            modules_by_package[package] = []
+        modules_by_package[package].append((module, nav_path))
+    else:
+        # Root level modules
+        module = parts[0]
+        if "root" not in modules_by_package:
+            modules_by_package["root"] = []
+        modules_by_package["root"].append((module, nav_path))
+
+for package, modules in modules_by_package.items():
+    if package == "root":
+        index_lines.append("### Root Modules")
+    else:
+        index_lines.append(f"### {package.title()} Package")
+    index_lines.append("")
+
+    for module_file, nav_path in modules:
+        module_name = module_file.replace(".md", "").replace("_", " ").title()
+        link_path = nav_path.replace("api/reference/", "")
+        index_lines.append(f"- **[{module_name}]({link_path})** - Detailed API documentation")
+    index_lines.append("")
+
+# The index only changes when modules are added, renamed or removed
+index_key = "api/reference/index.md"
+pages[index_key] = write_page(index_key, "\n".join(index_lines) + "\n", "", previous_pages.get(index_key, {}))
+
+for removed in sorted(previous_pages.keys() - pages.keys()):
+    prune_built_page(removed)
+
+if pages != previous_pages:
+    save_manifest(pages)
@@ -70,4 +70,5 @@ sleep 2
 
 # Start MkDocs development server
 echo "Launching documentation server..."
-uv run mkdocs serve -a 0.0.0.0:8008
\ No newline at end of file
+# --dirty only re-renders pages whose generated reference changed (see docs/gen_ref_pages.py)
+uv run mkdocs serve --dirty -a 0.0.0.0:8008
\ No newline at end of file
@@ -10,6 +10,7 @@ Features:
     - Interactive string processing
     - Number calculation with error handling
     - Third-party library log suppression
+    - Content-hash result cache shared across reruns, with hit/miss metrics
 
 Usage:
     uv run streamlit run src/demo_app.py --server.port 8521
@@ -21,6 +22,7 @@ import streamlit as st
 import logging
 # it will work if the repo is installed as a package by uv
 from libs.example_module1 import import_checking1, calculate_sum
+from libs.compute_cache import get_compute_cache
 
 # Configure logging for Streamlit app (only if not already configured)
 if not logging.getLogger().handlers:
@@ -36,6 +38,21 @@ if not logging.getLogger().handlers:
 
 logger = logging.getLogger(__name__)
 
+# Reruns with unchanged inputs are served from the process-wide cache
+compute_cache = get_compute_cache()
+cached_import_checking1 = compute_cache.cached(import_checking1)
+
+@compute_cache.cached
+def sum_numbers_text(numbers_text: str) -> tuple:
+    """Parse comma-separated numbers and return (parsed numbers, sum or None if any are malformed)."""
+    # Imported on first use: NumPy is only needed once numbers are entered
+    from libs.number_parsing import parse_numbers
+    parsed = parse_numbers(numbers_text)
+    if not parsed.ok:
+        return parsed, None
+    logger.info("Calculating sum for %d numbers", parsed.values.size)
+    return parsed, calculate_sum(parsed.values)
+
 st.set_page_config(page_title="Demo App", layout="wide")
 
 st.title("Demo Streamlit App - Package Import")
@@ -51,7 +68,7 @@ user_input = st.text_input("Enter something to check:")
 if user_input:
     st.subheader("Result")
     logger.info(f"Processing user input: {user_input[:50]}...")
-    result = import_checking1(user_input)
+    result = cached_import_checking1(user_input)
     st.write(result)
     st.success("Processing completed successfully")
 else:
@@ -65,22 +82,30 @@ numbers_input = st.text_input("Enter numbers separated by commas (e.g., 1,2,3,4,
 
 if numbers_input:
     try:
-        # Parse numbers
-        numbers = [float(x.strip()) for x in numbers_input.split(',')]
-        logger.info(f"Calculating sum for {len(numbers)} numbers")
-        
-        result = calculate_sum(numbers)
-        st.write(f"**Sum:** {result}")
-        st.write(f"**Count:** {len(numbers)} numbers")
-        st.success("Calculation completed")
+        parsed, result = sum_numbers_text(numbers_input)
+        if parsed.ok:
+            st.write(f"**Sum:** {result}")
+            st.write(f"**Count:** {parsed.values.size} numbers")
+            st.success("Calculation completed")
+        else:
+            shown = ", ".join(f"#{position + 1} ({token!r})" for position, token
+                              in zip(parsed.malformed_positions[:10].tolist(), parsed.malformed_tokens))
+            more = f" and {len(parsed.malformed_tokens) - 10} more" if len(parsed.malformed_tokens) > 10 else ""
+            logger.error("Input parsing error: %d malformed values", len(parsed.malformed_tokens))
+            st.error(f"Please enter valid numbers separated by commas. Malformed values: {shown}{more}")
         
-    except ValueError as e:
-        logger.error(f"Input parsing error: {e}")
-        st.error("Please enter valid numbers separated by commas")
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         st.error(f"Error: {str(e)}")
 
+# Cache metrics
+stats = compute_cache.stats()
+st.sidebar.subheader("Result Cache")
+st.sidebar.metric("Hits", stats.hits)
+st.sidebar.metric("Misses", stats.misses)
+st.sidebar.metric("Hit Rate", f"{stats.hit_rate:.0%}")
+st.sidebar.caption(f"{stats.size}/{stats.maxsize} entries, {stats.evictions} evicted, {stats.expirations} expired")
+
 # Footer
 st.divider()
 st.caption("Powered by Streamlit")
\ No newline at end of file
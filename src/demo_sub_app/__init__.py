@@ -1 +1,56 @@
-# This makes directory a Python package
\ No newline at end of file
+"""Direct-import demo app and its text analysis module.
+
+Public names of example_module2 are resolved on first access (PEP 562), so
+``import demo_sub_app`` does not import example_module2 or its logging
+dependencies until a name is used. The Streamlit app itself imports
+``example_module2`` directly from its own directory.
+
+Example:
+    >>> from demo_sub_app import process_text
+    >>> process_text("Hello world")["word_count"]
+    2
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Public names of example_module2, loaded with it on first access
+_LAZY_ATTRS = frozenset({
+    'import_checking2',
+    'process_text',
+    'process_text_stream',
+    'process_text_async',
+    'process_text_stream_async',
+    'iter_text_stream_counts',
+    'count_words',
+    'process_texts',
+    'process_texts_columnar',
+    'TextAnalysisColumns',
+    'ValidationSchema',
+    'CompiledValidator',
+    'validate_input',
+    'validate_inputs',
+    'ExampleClass',
+})
+
+__all__ = sorted(_LAZY_ATTRS)
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(".example_module2", __name__), name)
+    elif name == 'example_module2':
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Later lookups find the name directly and skip __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    return sorted(set(globals()) | _LAZY_ATTRS | {'example_module2'})
+
+if TYPE_CHECKING:
+    from .example_module2 import (CompiledValidator, ExampleClass, TextAnalysisColumns, ValidationSchema,
+                                  count_words, import_checking2, iter_text_stream_counts, process_text,
+                                  process_text_async, process_text_stream, process_text_stream_async,
+                                  process_texts, process_texts_columnar, validate_input, validate_inputs)
@@ -1,4 +1,3 @@
-
 """Example module demonstrating direct imports.
 
 This module shows how to organize utility functions that are imported
@@ -20,15 +19,37 @@ Example:
     INFO:example_module2:Processing direct import check with input: test...
 """
 
+import codecs
 import logging
-from datetime import datetime
-from typing import Dict, Any
-from libs.logging_utils import set_logger_w_obj_name
+import mmap
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, islice
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from libs.instrumentation import instrument
+from libs.logging_utils import ObjLogger, set_logger_w_obj_name
+
+# NumPy, datetime and the process pool are imported on first use, so
+# importing this module for single-document analysis stays cheap
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    import numpy as np
+    import pandas as pd
 
 # Configure module-level logger - NO handlers, NO setLevel
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+def _now_isoformat() -> str:
+    """Current local time in ISO 8601 format for the processed_at fields."""
+    from datetime import datetime
+    return datetime.now().isoformat()
+
 def import_checking2(test_str: str) -> str:
     """Check if direct import is working correctly.
     
@@ -45,44 +66,658 @@ def import_checking2(test_str: str) -> str:
         >>> import_checking2("Hello World")
         'Import import_checking2 successful, and here is your input: Hello World'
     """
-    logger.info(f"Processing direct import check with input: {test_str[:50]}...")
+    logger.info("Processing direct import check with input: %.50s...", test_str)
     result = f"Import import_checking2 successful, and here is your input: {test_str}"
-    logger.debug(f"Generated result: {result[:100]}...")
+    logger.debug("Generated result: %.100s...", result)
     return result
 
-def process_text(text: str) -> Dict[str, Any]:
+@instrument
+def process_text(text: str, include_text: bool = True, max_text_length: Optional[int] = None) -> Dict[str, Any]:
     """Process text and return analysis information.
     
+    Words are counted with count_words, so no list of all words is ever
+    built; peak extra memory is bounded by WORD_COUNT_WINDOW regardless of
+    the input size.
+    
     Args:
         text: The text string to analyze
+        include_text: Include the input as ``original_text`` (default: True)
+        max_text_length: Truncate ``original_text`` to this many characters,
+            None keeps it whole (default: None)
         
     Returns:
         Dictionary containing text analysis results including:
         - word_count: Number of words
         - char_count: Number of characters
         - processed_at: Timestamp of processing
+        - original_text: The (possibly truncated) input, if include_text
         
     Example:
         >>> result = process_text("Hello world")
         >>> result['word_count']
         2
+        >>> process_text("Hello world", max_text_length=5)['original_text']
+        'Hello'
     """
-    logger.debug(f"Processing text analysis for {len(text)} characters")
-    words = text.split()
+    logger.debug("Processing text analysis for %d characters", len(text))
+    word_count = count_words(text)
     
     result = {
-        "word_count": len(words),
+        "word_count": word_count,
         "char_count": len(text),
-        "processed_at": datetime.now().isoformat(),
-        "original_text": text
+        "processed_at": _now_isoformat()
     }
+    if include_text:
+        result["original_text"] = text if max_text_length is None else text[:max_text_length]
     
-    logger.info(f"Text analysis completed: {len(words)} words, {len(text)} characters")
+    logger.info("Text analysis completed: %d words, %d characters", word_count, len(text))
     return result
 
+# Bytes (or characters) read per step by process_text_stream
+TEXT_CHUNK_SIZE = 1 << 20
+
+# Characters split at a time by count_words (bounds its temporary memory)
+WORD_COUNT_WINDOW = 1 << 16
+
+def _iter_decoded(byte_chunks: Iterable[bytes], encoding: str) -> Iterator[str]:
+    """Decode byte chunks incrementally, so multi-byte characters may straddle chunks."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for raw in byte_chunks:
+        text = decoder.decode(raw)
+        if text:
+            yield text
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+def _iter_mmap_chunks(path: Path, chunk_size: int) -> Iterator[bytes]:
+    """Yield chunk_size slices of a memory-mapped file."""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, 'madvise'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            for start in range(0, size, chunk_size):
+                yield mapped[start:start + chunk_size]
+
+def _iter_file_chunks(f: IO, chunk_size: int) -> Iterator[Union[str, bytes]]:
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+def _iter_text_chunks(source: Union[str, os.PathLike, IO, Iterable[Union[str, bytes]]],
+                      chunk_size: int, encoding: str, use_mmap: bool) -> Iterator[str]:
+    """Normalize a path, file object or chunk iterator into decoded str chunks."""
+    if isinstance(source, (str, os.PathLike)):
+        path = Path(source)
+        if use_mmap:
+            yield from _iter_decoded(_iter_mmap_chunks(path, chunk_size), encoding)
+        else:
+            with open(path, 'rb') as f:
+                yield from _iter_decoded(_iter_file_chunks(f, chunk_size), encoding)
+        return
+    chunks = _iter_file_chunks(source, chunk_size) if hasattr(source, 'read') else iter(source)
+    first = next(chunks, None)
+    if first is None:
+        return
+    chunks = chain((first,), chunks)
+    if isinstance(first, (bytes, bytearray, memoryview)):
+        yield from _iter_decoded(chunks, encoding)
+    else:
+        yield from chunks
+
+def _chunk_word_count(chunk: str, in_word: bool) -> tuple:
+    """Return (new words in a non-empty chunk, whether it ends inside a word), given the previous chunk's state."""
+    words = len(chunk.split())
+    if in_word and not chunk[0].isspace():
+        # The first word continues the one the previous chunk ended with
+        words -= 1
+    return words, not chunk[-1].isspace()
+
+def _iter_running_counts(chunks: Iterable[str]) -> Iterator[tuple]:
+    """Yield running (words, chars) totals after each chunk, joining words across chunk boundaries."""
+    word_count = 0
+    char_count = 0
+    in_word = False
+    for chunk in chunks:
+        if not chunk:
+            continue
+        char_count += len(chunk)
+        words, in_word = _chunk_word_count(chunk, in_word)
+        word_count += words
+        yield word_count, char_count
+
+def _count_words_and_chars(chunks: Iterable[str]) -> tuple:
+    """Count words (as str.split() would) and characters across chunk boundaries."""
+    counts = (0, 0)
+    for counts in _iter_running_counts(chunks):
+        pass
+    return counts
+
+def count_words(text: str) -> int:
+    """Count words exactly like ``len(text.split())`` without building the word list.
+    
+    The text is split one WORD_COUNT_WINDOW-sized window at a time, so the
+    temporary allocations stay bounded for arbitrarily large inputs.
+    
+    Args:
+        text: The text string to count words in
+        
+    Returns:
+        Number of whitespace-separated words
+        
+    Example:
+        >>> count_words("Hello   big\nworld")
+        3
+    """
+    if len(text) <= WORD_COUNT_WINDOW:
+        return len(text.split())
+    windows = (text[start:start + WORD_COUNT_WINDOW] for start in range(0, len(text), WORD_COUNT_WINDOW))
+    return _count_words_and_chars(windows)[0]
+
+def process_text_stream(source: Union[str, os.PathLike, IO, Iterable[Union[str, bytes]]],
+                        chunk_size: int = TEXT_CHUNK_SIZE, encoding: str = 'utf-8',
+                        use_mmap: bool = True) -> Dict[str, Any]:
+    """Analyze text from a file or chunk stream in constant memory.
+    
+    Unlike process_text, the input is never held in memory as a whole:
+    words and characters are counted chunk by chunk, including words that
+    straddle chunk boundaries, and the text itself is not returned. Local
+    files are read through mmap by default.
+    
+    Args:
+        source: Path to a text file (str or PathLike), a text or binary file
+            object, or an iterable of str/bytes chunks
+        chunk_size: Bytes (or characters for text files) per read (default: TEXT_CHUNK_SIZE)
+        encoding: Encoding for byte input (default: 'utf-8')
+        use_mmap: Memory-map paths instead of reading them (default: True)
+        
+    Returns:
+        Dictionary containing text analysis results including:
+        - word_count: Number of words
+        - char_count: Number of characters (decoded, without newline translation)
+        - processed_at: Timestamp of processing
+        
+    Example:
+        >>> result = process_text_stream(["Hello wo", "rld again"])
+        >>> result['word_count']
+        3
+        >>> process_text_stream("/data/corpus.txt")['char_count']  # doctest: +SKIP
+        104857600
+    """
+    logger.debug("Processing streaming text analysis (chunk_size=%d, mmap=%s)", chunk_size, use_mmap)
+    word_count, char_count = _count_words_and_chars(
+        _iter_text_chunks(source, chunk_size, encoding, use_mmap)
+    )
+    
+    result = {
+        "word_count": word_count,
+        "char_count": char_count,
+        "processed_at": _now_isoformat()
+    }
+    
+    logger.info("Streaming text analysis completed: %d words, %d characters", word_count, char_count)
+    return result
+
+def iter_text_stream_counts(source: Union[str, os.PathLike, IO, Iterable[Union[str, bytes]]],
+                            chunk_size: int = TEXT_CHUNK_SIZE, encoding: str = 'utf-8',
+                            use_mmap: bool = True) -> Iterator[Dict[str, int]]:
+    """Analyze a text stream like process_text_stream, yielding partial results per chunk.
+    
+    Each item holds the exact totals for the text read so far, so callers
+    can render progress while a large file is still being processed. The
+    last item equals the counts process_text_stream would return.
+    
+    Args:
+        source: Path to a text file (str or PathLike), a text or binary file
+            object, or an iterable of str/bytes chunks
+        chunk_size: Bytes (or characters for text files) per read (default: TEXT_CHUNK_SIZE)
+        encoding: Encoding for byte input (default: 'utf-8')
+        use_mmap: Memory-map paths instead of reading them (default: True)
+        
+    Yields:
+        Dictionaries with running word_count and char_count
+        
+    Example:
+        >>> [p['word_count'] for p in iter_text_stream_counts(["Hello wo", "rld again"])]
+        [2, 3]
+    """
+    for word_count, char_count in _iter_running_counts(_iter_text_chunks(source, chunk_size, encoding, use_mmap)):
+        yield {"word_count": word_count, "char_count": char_count}
+
+async def process_text_async(text: str, include_text: bool = True,
+                             max_text_length: Optional[int] = None) -> Dict[str, Any]:
+    """Analyze text like process_text without blocking the event loop.
+    
+    Texts of at least ``ASYNC_OFFLOAD_THRESHOLD`` characters are counted on
+    the shared async executor (see libs.async_utils.offload); shorter ones
+    on the loop. Log records are handled off the loop.
+    
+    Args:
+        text: The text string to analyze
+        include_text: Include the input as ``original_text`` (default: True)
+        max_text_length: Truncate ``original_text`` to this many characters,
+            None keeps it whole (default: None)
+        
+    Returns:
+        The same dictionary as process_text
+        
+    Example:
+        >>> (await process_text_async("Hello world"))['word_count']
+        2
+    """
+    from libs.async_utils import ASYNC_OFFLOAD_THRESHOLD, get_nonblocking_logger, offload
+    log = get_nonblocking_logger(logger)
+    log.debug("Processing async text analysis for %d characters", len(text))
+    if len(text) >= ASYNC_OFFLOAD_THRESHOLD:
+        word_count = await offload(count_words, text)
+    else:
+        word_count = count_words(text)
+    
+    result = {
+        "word_count": word_count,
+        "char_count": len(text),
+        "processed_at": _now_isoformat()
+    }
+    if include_text:
+        result["original_text"] = text if max_text_length is None else text[:max_text_length]
+    
+    log.info("Async text analysis completed: %d words, %d characters", word_count, len(text))
+    return result
+
+async def process_text_stream_async(source: AsyncIterable[Union[str, bytes]],
+                                    encoding: str = 'utf-8') -> Dict[str, Any]:
+    """Analyze an async stream of text chunks like process_text_stream.
+    
+    Chunks are counted as they arrive, including words that straddle chunk
+    boundaries, and control returns to the event loop after each one.
+    Chunks of at least ``ASYNC_OFFLOAD_THRESHOLD`` characters are counted on
+    the shared async executor. Byte chunks are decoded incrementally.
+    
+    Args:
+        source: Async iterable of str or bytes chunks, e.g. a network or aiofiles reader
+        encoding: Encoding for byte chunks (default: 'utf-8')
+        
+    Returns:
+        Dictionary with word_count, char_count and processed_at, like
+        process_text_stream
+        
+    Example:
+        >>> async def chunks():
+        ...     yield b"Hello wo"
+        ...     yield b"rld again"
+        >>> (await process_text_stream_async(chunks()))['word_count']
+        3
+    """
+    import asyncio
+
+    from libs.async_utils import ASYNC_OFFLOAD_THRESHOLD, get_nonblocking_logger, offload
+    log = get_nonblocking_logger(logger)
+    log.debug("Processing async streaming text analysis")
+    
+    decoder = None
+    word_count = char_count = 0
+    in_word = False
+    async for chunk in source:
+        if isinstance(chunk, (bytes, bytearray, memoryview)):
+            decoder = decoder or codecs.getincrementaldecoder(encoding)()
+            chunk = decoder.decode(chunk)
+        if chunk:
+            char_count += len(chunk)
+            if len(chunk) >= ASYNC_OFFLOAD_THRESHOLD:
+                words, in_word = await offload(_chunk_word_count, chunk, in_word)
+            else:
+                words, in_word = _chunk_word_count(chunk, in_word)
+            word_count += words
+        # Let other tasks run between chunks
+        await asyncio.sleep(0)
+    tail = decoder.decode(b'', final=True) if decoder else ''
+    if tail:
+        char_count += len(tail)
+        word_count += _chunk_word_count(tail, in_word)[0]
+    
+    result = {
+        "word_count": word_count,
+        "char_count": char_count,
+        "processed_at": _now_isoformat()
+    }
+    
+    log.info("Async streaming text analysis completed: %d words, %d characters", word_count, char_count)
+    return result
+
+# Documents sent to a worker process per task by process_texts
+TEXT_BATCH_CHUNKSIZE = 256
+
+def _analyze_documents(texts: list) -> list:
+    """Worker task: (word_count, char_count) for each document, without logging."""
+    return [(count_words(text), len(text)) for text in texts]
+
+def _analyze_documents_columnar(texts: list) -> "np.ndarray":
+    """Worker task: int64 array of shape (2, len(texts)) with word and char counts."""
+    import numpy as np
+    counts = np.empty((2, len(texts)), dtype=np.int64)
+    for i, text in enumerate(texts):
+        counts[0, i] = count_words(text)
+        counts[1, i] = len(text)
+    return counts
+
+def _check_batch_args(workers: Optional[int], chunksize: int) -> None:
+    """Raise ValueError for a workers or chunksize argument below 1."""
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be >= 1, got {chunksize}")
+
+def _iter_batch_counts(texts: Iterable[str], workers: Optional[int], chunksize: int,
+                       ordered: bool, task: Callable[[list], Any]) -> Iterator[tuple]:
+    """Run task over chunksize batches of texts, yielding (start_index, batch, task_result).
+    
+    Batches go to the process pool shared with calculate_sum; if iteration
+    stops early, batches that have not started yet are cancelled.
+    """
+    n_workers = workers or os.cpu_count() or 1
+    logger.debug("Processing text batch (workers=%d, chunksize=%d, ordered=%s)", n_workers, chunksize, ordered)
+    iterator = iter(texts)
+    batches = iter(lambda: list(islice(iterator, chunksize)), [])
+    
+    start = 0
+    if n_workers == 1:
+        for batch in batches:
+            yield start, batch, task(batch)
+            start += len(batch)
+        return
+    
+    from concurrent.futures import FIRST_COMPLETED, wait
+    from libs.example_module1 import _get_executor
+    executor = _get_executor('process', n_workers)
+    pending: Dict["Future", tuple] = {}
+    try:
+        for batch in islice(batches, 2 * n_workers):
+            pending[executor.submit(task, batch)] = (start, batch)
+            start += len(batch)
+        while pending:
+            if ordered:
+                done = [next(iter(pending))]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch_start, batch = pending.pop(future)
+                yield batch_start, batch, future.result()
+                batch = next(batches, None)
+                if batch is not None:
+                    pending[executor.submit(task, batch)] = (start, batch)
+                    start += len(batch)
+    finally:
+        for future in pending:
+            future.cancel()
+
+def process_texts(texts: Iterable[str], workers: Optional[int] = None,
+                  chunksize: int = TEXT_BATCH_CHUNKSIZE, ordered: bool = True,
+                  include_text: bool = False, max_text_length: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Analyze many documents, fanning batches out across a process pool.
+    
+    Documents are sent to worker processes ``chunksize`` at a time, with at
+    most two batches per worker in flight, so the input iterable is consumed
+    lazily. Worker processes come from a pool shared across calls and with
+    calculate_sum. All results share one batch-level ``processed_at``
+    timestamp and the batch logs one summary line instead of two lines per
+    document. Arguments are checked when process_texts is called; documents
+    are analyzed as the returned iterator is consumed.
+    
+    Args:
+        texts: Iterable of text strings to analyze
+        workers: Worker processes; None uses one per CPU, 1 analyzes in the
+            calling process without a pool (default: None)
+        chunksize: Documents per worker task (default: TEXT_BATCH_CHUNKSIZE)
+        ordered: Yield results in input order; False yields each batch as
+            soon as it completes (default: True)
+        include_text: Include each document as ``original_text`` (default: False)
+        max_text_length: Truncate ``original_text`` to this many characters (default: None)
+        
+    Returns:
+        Iterator over one dictionary per document with ``index`` (position
+        in the input), ``word_count``, ``char_count``, ``processed_at`` and
+        optionally ``original_text``
+        
+    Raises:
+        ValueError: If workers or chunksize is < 1
+        
+    Example:
+        >>> results = list(process_texts(["Hello world", "One"], workers=1))
+        >>> [r['word_count'] for r in results]
+        [2, 1]
+    """
+    # Validate here, not in the generator, so bad arguments fail at the call
+    _check_batch_args(workers, chunksize)
+    return _iter_process_texts(texts, workers, chunksize, ordered, include_text, max_text_length)
+
+def _iter_process_texts(texts: Iterable[str], workers: Optional[int], chunksize: int, ordered: bool,
+                        include_text: bool, max_text_length: Optional[int]) -> Iterator[Dict[str, Any]]:
+    """Generator behind process_texts, called with validated arguments."""
+    processed_at = _now_isoformat()
+    n_documents = 0
+    total_words = 0
+    
+    for start, batch, counts in _iter_batch_counts(texts, workers, chunksize, ordered, _analyze_documents):
+        for offset, (text, (word_count, char_count)) in enumerate(zip(batch, counts)):
+            result = {
+                "index": start + offset,
+                "word_count": word_count,
+                "char_count": char_count,
+                "processed_at": processed_at
+            }
+            if include_text:
+                result["original_text"] = text if max_text_length is None else text[:max_text_length]
+            n_documents += 1
+            total_words += word_count
+            yield result
+    
+    logger.info("Batch text analysis completed: %d documents, %d words", n_documents, total_words)
+
+@dataclass(frozen=True)
+class TextAnalysisColumns:
+    """Columnar results of a text analysis batch.
+    
+    Counts live in one int64 array of shape (2, n), so ``word_count`` and
+    ``char_count`` are views of it and to_dataframe() wraps it without
+    copying. The batch has a single ``processed_at`` timestamp.
+    
+    Attributes:
+        counts: int64 array; row 0 holds word counts, row 1 character counts
+        processed_at: ISO timestamp shared by the whole batch
+        
+    Example:
+        >>> columns = process_texts_columnar(["Hello world", "One"], workers=1)
+        >>> columns.word_count
+        array([2, 1])
+        >>> int(columns.to_dataframe()['char_count'].sum())
+        14
+    """
+    counts: "np.ndarray"
+    processed_at: str
+    
+    @property
+    def word_count(self) -> "np.ndarray":
+        return self.counts[0]
+    
+    @property
+    def char_count(self) -> "np.ndarray":
+        return self.counts[1]
+    
+    def __len__(self) -> int:
+        return self.counts.shape[1]
+    
+    def to_dataframe(self) -> "pd.DataFrame":
+        """Wrap the counts in a pandas DataFrame without copying them.
+        
+        Returns:
+            DataFrame with ``word_count`` and ``char_count`` columns sharing
+            memory with ``counts``; the timestamp is in ``df.attrs['processed_at']``
+        """
+        import pandas as pd
+        
+        df = pd.DataFrame(self.counts.T, columns=["word_count", "char_count"], copy=False)
+        df.attrs["processed_at"] = self.processed_at
+        return df
+
+def process_texts_columnar(texts: Iterable[str], workers: Optional[int] = None,
+                           chunksize: int = TEXT_BATCH_CHUNKSIZE) -> TextAnalysisColumns:
+    """Analyze many documents and collect the results column-wise.
+    
+    Same fan-out as process_texts, but instead of one dictionary per
+    document the counts are gathered into NumPy arrays (workers return them
+    as arrays too), which keeps large batches compact and ready for
+    vectorized aggregation.
+    
+    Args:
+        texts: Iterable of text strings to analyze
+        workers: Worker processes; None uses one per CPU, 1 analyzes in the
+            calling process without a pool (default: None)
+        chunksize: Documents per worker task (default: TEXT_BATCH_CHUNKSIZE)
+        
+    Returns:
+        TextAnalysisColumns with results in input order
+        
+    Raises:
+        ValueError: If workers or chunksize is < 1
+        
+    Example:
+        >>> df = process_texts_columnar(documents).to_dataframe()
+        >>> df["word_count"].mean()  # doctest: +SKIP
+    """
+    import numpy as np
+    _check_batch_args(workers, chunksize)
+    processed_at = _now_isoformat()
+    parts = [counts for _, _, counts in
+             _iter_batch_counts(texts, workers, chunksize, True, _analyze_documents_columnar)]
+    counts = np.concatenate(parts, axis=1) if parts else np.empty((2, 0), dtype=np.int64)
+    
+    logger.info("Columnar text analysis completed: %d documents, %d words", counts.shape[1], int(counts[0].sum()))
+    return TextAnalysisColumns(counts, processed_at)
+
+@dataclass(frozen=True)
+class ValidationSchema:
+    """Declarative validation rules, compiled once into a reusable validator.
+    
+    Lengths are measured after stripping surrounding whitespace when ``strip``
+    is True (the validate_input rule); ``allowed_chars`` and ``pattern`` are
+    checked against the raw value, with ``pattern`` matched in full.
+    
+    Attributes:
+        type: Required type of the value (default: str)
+        min_length: Minimum length (default: 0, no check)
+        max_length: Maximum length, or None for no limit
+        pattern: Regular expression the whole value must match, or None
+        allowed_chars: String of permitted characters, or None for any
+        strip: Measure lengths on the whitespace-stripped value (default: True)
+        
+    Example:
+        >>> is_slug = ValidationSchema(min_length=3, max_length=32, pattern=r"[a-z][a-z0-9-]*").compile()
+        >>> is_slug("my-post"), is_slug("My Post")
+        (True, False)
+    """
+    type: type = str
+    min_length: int = 0
+    max_length: Optional[int] = None
+    pattern: Optional[str] = None
+    allowed_chars: Optional[str] = None
+    strip: bool = True
+    
+    def compile(self) -> "CompiledValidator":
+        """Return the compiled validator for this schema (cached per schema)."""
+        return _compile_schema(self)
+
+class CompiledValidator:
+    """Callable produced by ValidationSchema.compile().
+    
+    Holds only the checks the schema configures, as a tuple of precompiled
+    predicates ordered cheapest first (type, lengths, character set, regex),
+    so invalid values are rejected by the first check they fail. Instances
+    are immutable and safe to share between threads.
+    """
+    __slots__ = ('schema', '_checks')
+    
+    def __init__(self, schema: ValidationSchema, checks: Tuple[Tuple[str, Callable[[Any], bool]], ...]):
+        self.schema = schema
+        self._checks = checks
+    
+    def __call__(self, value: Any) -> bool:
+        for _, check in self._checks:
+            if not check(value):
+                return False
+        return True
+    
+    def failure_reason(self, value: Any) -> Optional[str]:
+        """Return the name of the first failing rule, or None if the value is valid.
+        
+        Rule names are the ValidationSchema field names: 'type', 'min_length',
+        'max_length', 'allowed_chars' and 'pattern'.
+        """
+        for reason, check in self._checks:
+            if not check(value):
+                return reason
+        return None
+    
+    def __repr__(self) -> str:
+        return f"CompiledValidator({self.schema!r})"
+
+@lru_cache(maxsize=256)
+def _compile_schema(schema: ValidationSchema) -> CompiledValidator:
+    """Build the check tuple for a schema; cached so equal schemas share one validator."""
+    string_rules = schema.min_length > 0 or schema.max_length is not None or schema.pattern is not None \
+        or schema.allowed_chars is not None
+    if string_rules and not issubclass(schema.type, str):
+        raise ValueError("Length, pattern and allowed_chars rules require a str schema type")
+    
+    expected_type = schema.type
+    checks = [('type', lambda value: isinstance(value, expected_type))]
+    
+    # The raw length bounds the stripped length, so it decides most values without stripping
+    min_length = schema.min_length
+    if min_length > 0:
+        if schema.strip:
+            checks.append(('min_length', lambda value: len(value) >= min_length and len(value.strip()) >= min_length))
+        else:
+            checks.append(('min_length', lambda value: len(value) >= min_length))
+    max_length = schema.max_length
+    if max_length is not None:
+        if schema.strip:
+            checks.append(('max_length', lambda value: len(value) <= max_length or len(value.strip()) <= max_length))
+        else:
+            checks.append(('max_length', lambda value: len(value) <= max_length))
+    
+    if schema.allowed_chars is not None:
+        disallowed = re.compile(f"[^{re.escape(schema.allowed_chars)}]").search if schema.allowed_chars \
+            else re.compile(r"[\s\S]").search
+        checks.append(('allowed_chars', lambda value: disallowed(value) is None))
+    if schema.pattern is not None:
+        fullmatch = re.compile(schema.pattern).fullmatch
+        checks.append(('pattern', lambda value: fullmatch(value) is not None))
+    
+    logger.debug("Compiled validator with rules: %s", [reason for reason, _ in checks])
+    return CompiledValidator(schema, tuple(checks))
+
+# validate_input's validators by min_length: one dict lookup per call instead of building and hashing a schema
+_input_validators: Dict[int, CompiledValidator] = {}
+
+def _new_input_validator(min_length: int) -> CompiledValidator:
+    validator = _compile_schema(ValidationSchema(min_length=max(min_length, 0)))
+    # Same bound as the _compile_schema cache
+    if len(_input_validators) < 256:
+        _input_validators[min_length] = validator
+    return validator
+
+@instrument
 def validate_input(value: str, min_length: int = 1) -> bool:
     """Validate input string meets minimum requirements.
     
+    Uses the compiled ValidationSchema(min_length=min_length) validator, which
+    is built once per min_length and reused on later calls.
+    
     Args:
         value: String to validate
         min_length: Minimum required length (default: 1)
@@ -96,16 +731,79 @@ def validate_input(value: str, min_length: int = 1) -> bool:
         >>> validate_input("hi", 3)
         False
     """
-    logger.debug(f"Validating input: type={type(value).__name__}, length={len(value) if isinstance(value, str) else 'N/A'}, min_length={min_length}")
+    # Guard the debug line: the type/length ternary is evaluated eagerly otherwise
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Validating input: type=%s, length=%s, min_length=%s",
+                     type(value).__name__, len(value) if isinstance(value, str) else 'N/A', min_length)
     
-    is_valid = isinstance(value, str) and len(value.strip()) >= min_length
+    validator = _input_validators.get(min_length) or _new_input_validator(min_length)
+    reason = validator.failure_reason(value)
     
-    if is_valid:
+    if reason is None:
         logger.debug("Input validation passed")
+        return True
+    if reason == 'type':
+        logger.warning("Input validation failed: not string")
+    else:
+        logger.warning("Input validation failed: length %d < %s", len(value.strip()), min_length)
+    return False
+
+def validate_inputs(values: Union[Iterable[Any], "np.ndarray", "pd.Series"], min_length: int = 1) -> "np.ndarray":
+    """Validate many values at once, with the same rule as validate_input.
+    
+    Types are checked with one vectorized pass and the stripped lengths are
+    gathered into a single array in one C-level pass of ``str.strip``, the
+    operation validate_input uses, so both agree on every value (NumPy
+    string operations treat NUL as padding and cannot hold lone
+    surrogates). The batch logs one summary line with failure counts by
+    reason instead of one warning per failing value.
+    
+    Args:
+        values: Sequence, NumPy array or pandas Series of values to validate
+        min_length: Minimum required length after stripping whitespace (default: 1)
+        
+    Returns:
+        Boolean NumPy array, True where the value is a string meeting min_length
+        
+    Example:
+        >>> validate_inputs(["test", "  a  ", None, ""], min_length=2)
+        array([ True, False, False, False])
+    """
+    import numpy as np
+    if hasattr(values, 'to_numpy'):
+        values = values.to_numpy()
+    elif not isinstance(values, np.ndarray):
+        values = np.array(values if isinstance(values, (list, tuple)) else list(values), dtype=object)
+    values = values.reshape(-1)
+    
+    if values.dtype.kind == 'U' or values.dtype.kind == 'T':
+        # Plain NumPy string arrays (fixed-width or StringDType) hold only strings
+        is_string = np.ones(values.shape, dtype=bool)
+        strings = values.tolist()
     else:
-        logger.warning(f"Input validation failed: {'not string' if not isinstance(value, str) else f'length {len(value.strip())} < {min_length}'}")
+        if values.dtype != object:
+            values = values.astype(object)
+        is_string = np.frompyfunc(type, 1, 1)(values) == str
+        if not is_string.all():
+            # Rare str subclasses are still strings for isinstance()
+            candidates = np.flatnonzero(~is_string)
+            is_string[candidates] = [isinstance(value, str) for value in values[candidates]]
+        strings = values[is_string].tolist()
+    
+    mask = is_string.copy()
+    if strings:
+        # str.strip returns the string itself when there is nothing to strip
+        lengths = np.fromiter(map(len, map(str.strip, strings)), dtype=np.int64, count=len(strings))
+        mask[is_string] = lengths >= min_length
     
-    return is_valid
+    not_string = int(values.size - is_string.sum())
+    too_short = int(is_string.sum() - mask.sum())
+    if not_string or too_short:
+        logger.warning("Bulk input validation: %d of %d failed (not string=%d, too short=%d, min_length=%s)",
+                       not_string + too_short, values.size, not_string, too_short, min_length)
+    else:
+        logger.debug("Bulk input validation passed for %d values", values.size)
+    return mask
 
 class ExampleClass:
     """Example class demonstrating class-based logging patterns.
@@ -117,6 +815,7 @@ class ExampleClass:
     
     Attributes:
         logger: Instance-level logger with class context
+        method_logger: Logger for example_method, bound once per class by ObjLogger
         
     Example:
         >>> import logging
@@ -126,6 +825,8 @@ class ExampleClass:
         INFO:example_module2.ExampleClass.example_method:Example logging by method logger...
         INFO:example_module2.ExampleClass:Example logging by instance logger...
     """
+    method_logger = ObjLogger("example_method")
+
     def __init__(self):
         """Initialize ExampleClass with instance-level logger.
         
@@ -134,11 +835,13 @@ class ExampleClass:
         """
         # Initialize logger for this instance
         self.logger = set_logger_w_obj_name(eliminate_init=True)
+    @instrument
     def example_method(self, param: str) -> str:
         """Demonstrate different logging approaches within a class method.
         
         This method shows two different logging patterns:
-        1. Method-level logger: Creates hierarchical name (module.Class.method)
+        1. Method-level logger: Hierarchical name (module.Class.method), resolved
+           once per class by the ObjLogger descriptor instead of per call
         2. Instance-level logger: Uses the class-level logger initialized in __init__
         
         Args:
@@ -156,15 +859,16 @@ class ExampleClass:
             The method demonstrates both logging approaches to show the difference
             in logger naming and context. In production, choose one consistent approach.
         """
-        logger = set_logger_w_obj_name()
+        logger = self.method_logger
         # Note that logger and self.logger would be different, depends on how details you want to log
-        logger.info(f"Example logging by `method logger` - Executing example_method with param: {param[:50]}...")
-        self.logger.info(f"Example logging by `instance logger` - Executing example_method with param: {param[:50]}...")
+        logger.info("Example logging by `method logger` - Executing example_method with param: %.50s...", param)
+        self.logger.info("Example logging by `instance logger` - Executing example_method with param: %.50s...", param)
 
         return f"Method executed with param: {param}"
     
 if __name__ == "__main__":
     import sys
+    import numpy as np
     import logging  # Import logging for test execution
     
     # Test-specific logging (terminal only, configurable level)
@@ -189,6 +893,49 @@ if __name__ == "__main__":
     test_text = "This is a sample text for analysis with multiple words."
     analysis_result = process_text(test_text)
     print(f"Test 2 Result: Text analysis - {analysis_result}")
+    print(f"Test 2a Result: Truncated - {process_text(test_text, max_text_length=10)['original_text']!r}, "
+          f"omitted - {'original_text' in process_text(test_text, include_text=False)}")
+    
+    # Test process_text_stream with a word split across chunk boundaries
+    stream_result = process_text_stream(["This is a sam", "ple text for analysis ", "with multiple words."])
+    print(f"Test 2b Result: Streaming analysis - {stream_result}")
+    encoded = test_text.encode()
+    partials = list(iter_text_stream_counts(encoded[i:i + 16] for i in range(0, len(encoded), 16)))
+    print(f"Test 2b Result: Partial word counts - {[p['word_count'] for p in partials]}")
+    assert stream_result["word_count"] == analysis_result["word_count"]
+    
+    # Test the async variants, offloading a large chunk to the shared pool
+    import asyncio
+    
+    from libs.async_utils import ASYNC_OFFLOAD_THRESHOLD, stop_nonblocking_logging
+    
+    async def byte_chunks():
+        encoded_words = "Große Wörter ".encode()
+        yield encoded_words[:9]  # Ends inside the two bytes of 'ö'
+        yield encoded_words[9:]
+        yield b"x " * ASYNC_OFFLOAD_THRESHOLD
+    
+    async_result = asyncio.run(process_text_async(test_text, include_text=False))
+    async_stream_result = asyncio.run(process_text_stream_async(byte_chunks()))
+    stop_nonblocking_logging()
+    print(f"Test 2e Result: Async analysis - {async_result['word_count']} words, "
+          f"stream - {async_stream_result['word_count']} words, {async_stream_result['char_count']} characters")
+    assert async_result["word_count"] == analysis_result["word_count"]
+    assert async_stream_result["word_count"] == 2 + ASYNC_OFFLOAD_THRESHOLD
+    
+    # Test process_texts batch API across worker processes
+    batch_results = list(process_texts([test_text, "two words", ""], workers=2, chunksize=1))
+    print(f"Test 2c Result: Batch analysis - {[r['word_count'] for r in batch_results]}")
+    unordered = sorted((r['index'], r['word_count']) for r in
+                       process_texts([test_text, "two words", ""], workers=2, chunksize=1, ordered=False))
+    assert unordered == [(r['index'], r['word_count']) for r in batch_results]
+    try:
+        process_texts([test_text], chunksize=0)
+        print("Test 2c Result: ✗ chunksize=0 accepted")
+    except ValueError as e:
+        print(f"Test 2c Result: ✓ Rejected at call time - {e}")
+    columns = process_texts_columnar([test_text, "two words", ""], workers=1)
+    print(f"Test 2d Result: Columnar analysis -\n{columns.to_dataframe()}")
     
     # Test validate_input
     valid_tests = [
@@ -203,7 +950,70 @@ if __name__ == "__main__":
         status = "✓" if result == expected else "✗"
         print(f"Test {i} Result: {status} validate_input({repr(text)}, {min_len}) = {result}")
     
+    # Test validate_inputs bulk validation against the single-value results
+    bulk_mask = validate_inputs(["valid text", "  padded  ", "", 123], min_length=5)
+    print(f"Test 7 Result: validate_inputs mask = {bulk_mask.tolist()}")
+    # NULs and lone surrogates are ordinary characters for both validators
+    edge_cases = ["ok", "\ud800", "\x00", "a\x00", " \x00 ", "\u3000", "\u3000a\u3000", None, b"bytes"]
+    for min_len in (1, 2):
+        assert validate_inputs(edge_cases, min_len).tolist() == [validate_input(x, min_len) for x in edge_cases]
+    # StringDType keeps NULs (but cannot hold surrogates)
+    string_array = np.array(edge_cases[2:7], dtype=np.dtypes.StringDType())
+    assert validate_inputs(string_array, 2).tolist() == [validate_input(x, 2) for x in edge_cases[2:7]]
+    print("Test 7 Result: validate_inputs matches validate_input on NUL, surrogate and Unicode space edge cases")
+    
+    # Test a compiled validation schema and its first-failing-rule reporting
+    is_slug = ValidationSchema(min_length=3, max_length=16, pattern=r"[a-z][a-z0-9-]*").compile()
+    slug_results = {text: is_slug.failure_reason(text) for text in ["my-post", "My Post", "ab", None]}
+    print(f"Test 8 Result: compiled validator failures = {slug_results}")
+    
     print("Module testing completed")
 
     ec = ExampleClass()
-    ec.example_method("Testing example method logging")
\ No newline at end of file
+    ec.example_method("Testing example method logging")
+    
+    # Memory benchmark on a 100MB document: python example_module2.py --benchmark
+    if "--benchmark" in sys.argv:
+        import json
+        import time
+        import tracemalloc
+        
+        logging.getLogger().setLevel(logging.WARNING)
+        document = ("lorem ipsum dolor sit amet, consectetur adipiscing elit\n" * 2_000_000)[:100 * 1024 * 1024]
+        
+        def old_process_text(text):
+            words = text.split()
+            return {"word_count": len(words), "char_count": len(text),
+                    "processed_at": _now_isoformat(), "original_text": text}
+        
+        print(f"\nMemory benchmark: {len(document) / 2**20:.0f} MB document")
+        for label, func in (("old (text.split())", old_process_text),
+                            ("new (full text)", process_text),
+                            ("new (max_text_length=100)", lambda text: process_text(text, max_text_length=100))):
+            start = time.perf_counter()
+            func(document)
+            elapsed = time.perf_counter() - start
+            tracemalloc.start()
+            result = func(document)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            result_size = len(json.dumps(result))
+            print(f"  {label:<27}: peak {peak / 2**20:8.1f} MB, {elapsed * 1e3:7.0f} ms, "
+                  f"serialized result {result_size / 2**20:8.2f} MB, words={result['word_count']}")
+        
+        # Batch API vs a sequential process_text loop
+        corpus = [f"document {i} " + "lorem ipsum dolor sit amet " * 8 for i in range(200_000)]
+        start = time.perf_counter()
+        for doc in corpus:
+            process_text(doc)
+        sequential = time.perf_counter() - start
+        print(f"\nBatch benchmark: {len(corpus):,} documents")
+        print(f"  sequential process_text loop  : {sequential * 1e3:8.0f} ms (1.0x)")
+        for n_workers in sorted({1, os.cpu_count() or 1}):
+            for ordered in (True, False):
+                start = time.perf_counter()
+                for _ in process_texts(corpus, workers=n_workers, ordered=ordered):
+                    pass
+                elapsed = time.perf_counter() - start
+                print(f"  process_texts(workers={n_workers:<2}, ordered={ordered!s:<5}): "
+                      f"{elapsed * 1e3:8.0f} ms ({sequential / elapsed:.1f}x)")
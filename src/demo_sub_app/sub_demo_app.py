@@ -10,6 +10,8 @@ Features:
     - Interactive text analysis
     - Input validation with detailed feedback
     - Class method logging demonstrations
+    - Content-hash result cache shared across reruns, with hit/miss metrics
+    - Bulk analysis of uploaded text/CSV/XLSX files with live progress
 
 Usage:
     uv run streamlit run src/demo_sub_app/sub_demo_app.py --server.port 8521
@@ -19,8 +21,17 @@ Author: New Python Repo Template
 
 import streamlit as st
 import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Tuple
+
 # it will work if the repo is installed as a package by uv
-from example_module2 import import_checking2, process_text, validate_input
+from example_module2 import (TEXT_CHUNK_SIZE, count_words, import_checking2, iter_text_stream_counts,
+                             process_text, validate_input)
+from libs.compute_cache import content_hash, get_compute_cache
+from libs.example_module1 import calculate_sum
+
+# pandas is only needed once a CSV/XLSX file is uploaded
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 # Configure logging for Streamlit app (only if not already configured)
@@ -37,6 +48,113 @@ if not logging.getLogger().handlers:
 
 logger = logging.getLogger(__name__)
 
+# Reruns with unchanged inputs are served from the process-wide cache
+compute_cache = get_compute_cache()
+cached_import_checking2 = compute_cache.cached(import_checking2)
+cached_validate_input = compute_cache.cached(validate_input)
+
+@compute_cache.cached
+def cached_process_text(text: str) -> dict:
+    """Analyze text without keeping a copy of it in the cached result (entries may be multi-megabyte texts)."""
+    return process_text(text, include_text=False)
+
+# Spreadsheet rows analyzed per step of the bulk upload analysis
+BULK_ROWS_PER_CHUNK = 10_000
+
+def iter_upload_bytes(uploaded: Any, chunk_size: int = TEXT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Read an uploaded file in chunks instead of as one multi-megabyte string."""
+    uploaded.seek(0)
+    while True:
+        chunk = uploaded.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+def iter_table_chunks(uploaded: Any, kind: str) -> Iterator[Tuple["pd.DataFrame", float]]:
+    """Yield (rows, fraction of the file done) for an uploaded CSV or XLSX file."""
+    import pandas as pd
+    uploaded.seek(0)
+    if kind == "csv":
+        for frame in pd.read_csv(uploaded, chunksize=BULK_ROWS_PER_CHUNK):
+            yield frame, uploaded.tell() / max(uploaded.size, 1)
+        return
+    
+    import zipfile
+
+    from openpyxl import load_workbook
+    from openpyxl.utils.exceptions import InvalidFileException
+    try:
+        workbook = load_workbook(uploaded, read_only=True, data_only=True)
+    except (zipfile.BadZipFile, InvalidFileException, KeyError) as e:
+        # Corrupt or renamed files; KeyError is a zip archive without workbook parts
+        raise ValueError(f"not a readable XLSX workbook ({e})") from e
+    try:
+        sheet = workbook.active
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [str(name) if name is not None else f"column_{i}" for i, name in enumerate(header)]
+        total_rows = max((sheet.max_row or 0) - 1, 1)
+        done = 0
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == BULK_ROWS_PER_CHUNK:
+                done += len(batch)
+                yield pd.DataFrame.from_records(batch, columns=columns), done / total_rows
+                batch = []
+        if batch:
+            done += len(batch)
+            yield pd.DataFrame.from_records(batch, columns=columns), done / total_rows
+    finally:
+        workbook.close()
+
+def add_table_chunk(totals: Dict[str, Any], frame: "pd.DataFrame") -> None:
+    """Fold one chunk of rows into the running totals: vectorized column sums and text counts."""
+    totals["rows"] += len(frame)
+    column_sums = totals["column_sums"]
+    for name in frame.select_dtypes(include="number").columns:
+        values = frame[name].dropna().to_numpy()
+        column_sums[name] = column_sums.get(name, 0.0) + calculate_sum(values)
+    for name in frame.select_dtypes(exclude=["number", "bool", "datetime"]).columns:
+        cells = frame[name].dropna().astype(str).tolist()
+        if cells:
+            joined = " ".join(cells)
+            totals["word_count"] += count_words(joined)
+            totals["char_count"] += len(joined) - (len(cells) - 1)
+
+def analyze_upload(uploaded: Any, kind: str, render: Callable[[Dict[str, Any], float], None]) -> Dict[str, Any]:
+    """Analyze an uploaded file chunk by chunk, rendering partial totals after each chunk."""
+    logger.info("Starting bulk analysis of %s (%d bytes)", uploaded.name, uploaded.size)
+    if kind == "txt":
+        totals = {"word_count": 0, "char_count": 0}
+        for partial in iter_text_stream_counts(iter_upload_bytes(uploaded)):
+            totals.update(partial)
+            render(totals, uploaded.tell() / max(uploaded.size, 1))
+    else:
+        totals = {"rows": 0, "word_count": 0, "char_count": 0, "column_sums": {}}
+        for frame, fraction in iter_table_chunks(uploaded, kind):
+            add_table_chunk(totals, frame)
+            render(totals, fraction)
+    logger.info("Bulk analysis completed: %d words, %d characters", totals["word_count"], totals["char_count"])
+    return totals
+
+def render_bulk_totals(progress: Any, slot: Any, totals: Dict[str, Any], fraction: float) -> None:
+    """Redraw the progress bar and the partial results placeholder."""
+    fraction = min(fraction, 1.0)
+    progress.progress(fraction, text=f"Analyzed {fraction:.0%}")
+    with slot.container():
+        cols = st.columns(3)
+        cols[0].metric("Word Count", totals["word_count"])
+        cols[1].metric("Character Count", totals["char_count"])
+        if "rows" in totals:
+            cols[2].metric("Rows", totals["rows"])
+        if totals.get("column_sums"):
+            import pandas as pd
+            st.write("**Numeric Column Sums:**")
+            st.dataframe(pd.Series(totals["column_sums"], name="sum"))
+
 st.set_page_config(page_title="Demo Sub App", layout="wide")
 
 st.title("Demo Streamlit App - Direct Import")
@@ -52,7 +170,7 @@ user_input = st.text_input("Enter something to check:")
 if user_input:
     st.subheader("Import Check Result")
     logger.info(f"Processing user input: {user_input[:50]}...")
-    result = import_checking2(user_input)
+    result = cached_import_checking2(user_input)
     st.write(result)
     st.success("Import check completed")
 else:
@@ -66,10 +184,10 @@ if analysis_text:
     logger.info(f"Starting text analysis for {len(analysis_text)} characters")
     
     # Validate input
-    is_valid = validate_input(analysis_text, min_length=1)
+    is_valid = cached_validate_input(analysis_text, min_length=1)
     
     if is_valid:
-        analysis_result = process_text(analysis_text)
+        analysis_result = cached_process_text(analysis_text)
         
         col1, col2 = st.columns(2)
         with col1:
@@ -86,6 +204,36 @@ if analysis_text:
 else:
     st.info("Enter text above to analyze")
 
+# Bulk file analysis section
+st.subheader("Bulk File Analysis")
+uploaded = st.file_uploader("Upload a text, CSV or XLSX file:", type=["txt", "csv", "xlsx"])
+
+if uploaded is not None:
+    kind = uploaded.name.rsplit(".", 1)[-1].lower()
+    progress = st.progress(0.0, text="Starting analysis...")
+    results_slot = st.empty()
+    render = lambda totals, fraction: render_bulk_totals(progress, results_slot, totals, fraction)
+    
+    # The upload is already in memory; hashing its buffer lets reruns skip the analysis
+    key = f"bulk:{kind}:" + content_hash(uploaded.getbuffer())
+    try:
+        totals = compute_cache.get_or_compute(key, lambda: analyze_upload(uploaded, kind, render))
+        render(totals, 1.0)
+        st.success(f"Bulk analysis of {uploaded.name} completed")
+    except (UnicodeDecodeError, ValueError) as e:
+        logger.error("Bulk analysis failed for %s: %s", uploaded.name, e)
+        st.error(f"Could not analyze {uploaded.name}: {e}")
+else:
+    st.info("Upload a file to analyze it in chunks")
+
+# Cache metrics
+stats = compute_cache.stats()
+st.sidebar.subheader("Result Cache")
+st.sidebar.metric("Hits", stats.hits)
+st.sidebar.metric("Misses", stats.misses)
+st.sidebar.metric("Hit Rate", f"{stats.hit_rate:.0%}")
+st.sidebar.caption(f"{stats.size}/{stats.maxsize} entries, {stats.evictions} evicted, {stats.expirations} expired")
+
 # Footer
 st.divider()
 st.caption("Powered by Streamlit")
\ No newline at end of file
@@ -1 +1,77 @@
-# This makes directory a Python package
\ No newline at end of file
+"""Reusable utility modules shared by the demo apps.
+
+Public names are resolved on first access (PEP 562), so ``import libs``
+costs almost nothing and ``from libs import calculate_sum`` only imports
+the submodule that defines it. Importing a submodule directly, e.g.
+``from libs.example_module1 import calculate_sum``, works as before.
+
+Example:
+    >>> from libs import calculate_sum, parse_numbers
+    >>> calculate_sum(parse_numbers("1, 2, 3").values)
+    6.0
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Public name -> submodule defining it
+_LAZY_ATTRS = {
+    'import_checking1': 'example_module1',
+    'calculate_sum': 'example_module1',
+    'calculate_sum_async': 'example_module1',
+    'format_message': 'example_module1',
+    'offload': 'async_utils',
+    'configure_offload': 'async_utils',
+    'get_nonblocking_logger': 'async_utils',
+    'ComputeCache': 'compute_cache',
+    'CacheStats': 'compute_cache',
+    'content_hash': 'compute_cache',
+    'get_compute_cache': 'compute_cache',
+    'FunctionStats': 'instrumentation',
+    'instrument': 'instrumentation',
+    'timed': 'instrumentation',
+    'get_instrumentation_snapshot': 'instrumentation',
+    'reset_instrumentation': 'instrumentation',
+    'start_periodic_logging': 'instrumentation',
+    'stop_periodic_logging': 'instrumentation',
+    'ParsedNumbers': 'number_parsing',
+    'parse_numbers': 'number_parsing',
+    'ObjLogger': 'logging_utils',
+    'bind_log_context': 'logging_utils',
+    'get_log_context': 'logging_utils',
+    'log_context': 'logging_utils',
+    'reset_log_context': 'logging_utils',
+    'get_obj_logger': 'logging_utils',
+    'obj_logger': 'logging_utils',
+    'set_logger_w_obj_name': 'logging_utils',
+    'setup_development_logging': 'logging_utils',
+    'setup_production_logging': 'logging_utils',
+}
+_SUBMODULES = frozenset(_LAZY_ATTRS.values())
+
+__all__ = sorted(_LAZY_ATTRS)
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Later lookups find the name directly and skip __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
+
+if TYPE_CHECKING:
+    from .async_utils import configure_offload, get_nonblocking_logger, offload
+    from .compute_cache import CacheStats, ComputeCache, content_hash, get_compute_cache
+    from .example_module1 import calculate_sum, calculate_sum_async, format_message, import_checking1
+    from .instrumentation import (FunctionStats, get_instrumentation_snapshot, instrument, reset_instrumentation,
+                                  start_periodic_logging, stop_periodic_logging, timed)
+    from .logging_utils import (ObjLogger, bind_log_context, get_log_context, get_obj_logger, log_context,
+                                obj_logger, reset_log_context, set_logger_w_obj_name, setup_development_logging,
+                                setup_production_logging)
+    from .number_parsing import ParsedNumbers, parse_numbers
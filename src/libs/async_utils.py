@@ -0,0 +1,411 @@
+"""Asyncio support shared by the async variants of the library functions.
+
+The async variants (``calculate_sum_async``, ``process_text_async``,
+``process_text_stream_async``) run small pieces of work directly on the
+event loop, yield to it between chunks, and hand large pieces to one
+shared thread pool. Concurrency is bounded per event loop: callers beyond
+the limit wait on the loop instead of piling work into the pool's queue.
+
+Logging from coroutines goes through NonBlockingLogger: the record is
+built on the loop (so it carries the caller's location, thread and
+context) and handled, i.e. filtered, formatted and written, on a
+background thread.
+
+asyncio itself is imported on first use, so importing this module stays
+cheap for synchronous callers.
+
+Features:
+    - Shared, bounded thread pool for CPU-heavy calls (offload)
+    - Per-loop concurrency limit with backpressure
+    - Context variables propagated to offloaded calls and log handling
+    - Logger facade that never runs handlers on the event loop
+
+Example:
+    >>> import asyncio
+    >>> from libs.async_utils import offload
+    >>> asyncio.run(offload(sum, range(10)))
+    45
+"""
+
+import atexit
+import contextvars
+import functools
+import logging
+import os
+import sys
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, TypeVar, Union
+
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+# Configure module-level logger - NO handlers, NO setLevel
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Threads in the shared pool, which is also the number of offloaded calls in flight per event loop
+ASYNC_OFFLOAD_WORKERS = min(4, os.cpu_count() or 1)
+
+# Items (numbers or characters) from which the async variants offload a piece of work
+ASYNC_OFFLOAD_THRESHOLD = 1 << 16
+
+T = TypeVar("T")
+
+_executor: Optional["ThreadPoolExecutor"] = None
+_executor_lock = threading.Lock()
+_loop_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+def get_offload_executor() -> "ThreadPoolExecutor":
+    """Return the shared thread pool used by offload(), creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _executor = ThreadPoolExecutor(max_workers=ASYNC_OFFLOAD_WORKERS, thread_name_prefix='async-offload')
+        return _executor
+
+def configure_offload(max_workers: int) -> None:
+    """
+    Resize the shared pool and the per-loop concurrency limit.
+
+    Calls already running finish on the old pool; new calls use the new one.
+
+    Args:
+        max_workers: Threads in the pool and offloaded calls in flight per loop
+
+    Raises:
+        ValueError: If max_workers < 1
+    """
+    global ASYNC_OFFLOAD_WORKERS, _executor
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+    with _executor_lock:
+        old, _executor = _executor, None
+        ASYNC_OFFLOAD_WORKERS = max_workers
+        _loop_limits.clear()
+    if old is not None:
+        old.shutdown(wait=False)
+    logger.info("Async offload pool resized to %d workers", max_workers)
+
+def _loop_limit(loop: "asyncio.AbstractEventLoop") -> "asyncio.Semaphore":
+    # Only touched from the loop's own thread, so no lock is needed
+    limit = _loop_limits.get(loop)
+    if limit is None:
+        import asyncio
+        limit = _loop_limits[loop] = asyncio.Semaphore(ASYNC_OFFLOAD_WORKERS)
+    return limit
+
+async def offload(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking or CPU-heavy call on the shared pool without blocking the loop.
+
+    At most ASYNC_OFFLOAD_WORKERS calls per event loop run at once; further
+    callers wait (on the loop) for a free slot. The call runs in a copy of
+    the caller's context variables, like ``asyncio.to_thread``.
+
+    Args:
+        func: Callable to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        func's return value; its exceptions propagate to the awaiting caller
+
+    Example:
+        >>> total = await offload(calculate_sum, big_array)
+    """
+    import asyncio
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    async with _loop_limit(loop):
+        return await loop.run_in_executor(get_offload_executor(), call)
+
+# Records queued for the log thread, and what happens when they do not fit (see BoundedQueueHandler).
+# On an event-loop thread a full queue never blocks: policies that would wait evict the oldest record
+NONBLOCKING_LOG_QUEUE_SIZE = 10000
+NONBLOCKING_LOG_OVERFLOW_POLICY = 'drop_oldest'
+
+# Active log thread, if any: (queue handler, thread), and the number of producers enqueueing to it.
+# stop_nonblocking_logging waits for the producers before queueing its sentinel, so no record lands
+# behind it; producers do not hold the lock while they enqueue
+_log_pipeline: Optional[tuple] = None
+_log_lock = threading.Lock()
+_log_idle = threading.Condition(_log_lock)
+_log_producers = 0
+
+def _handle_records(log_queue) -> None:
+    while True:
+        record = log_queue.get()
+        if record is None:
+            return
+        context, target = record.__dict__.pop('_nonblocking_target')
+        try:
+            context.run(target.handle, record)
+        except Exception:
+            # Handlers report their own errors; this only guards the thread itself
+            sys.stderr.write(f"--- Logging error ---\nNon-blocking log record for {record.name} failed\n")
+
+def _start_log_thread():
+    # Called with _log_lock held
+    global _log_pipeline
+    import queue
+
+    from libs.logging_utils import BoundedQueueHandler
+    queue_handler = BoundedQueueHandler(queue.Queue(maxsize=NONBLOCKING_LOG_QUEUE_SIZE),
+                                        NONBLOCKING_LOG_OVERFLOW_POLICY)
+    thread = threading.Thread(target=_handle_records, args=(queue_handler.queue,),
+                              name='nonblocking-log', daemon=True)
+    thread.start()
+    _log_pipeline = (queue_handler, thread)
+    atexit.unregister(stop_nonblocking_logging)
+    atexit.register(stop_nonblocking_logging)
+    return queue_handler
+
+def stop_nonblocking_logging() -> None:
+    """
+    Handle every queued record and stop the log thread.
+
+    Registered with atexit when the first record is queued; a later record
+    starts a new thread.
+    """
+    global _log_pipeline
+    with _log_lock:
+        pipeline, _log_pipeline = _log_pipeline, None
+        _log_idle.wait_for(lambda: _log_producers == 0)
+    if pipeline is not None:
+        queue_handler, thread = pipeline
+        queue_handler.queue.put(None)
+        thread.join()
+        if queue_handler.dropped:
+            logger.warning("Non-blocking logging dropped records: %s", queue_handler.dropped)
+
+def configure_nonblocking_logging(queue_size: int = NONBLOCKING_LOG_QUEUE_SIZE,
+                                  overflow_policy: str = NONBLOCKING_LOG_OVERFLOW_POLICY) -> None:
+    """
+    Bound the queue of the non-blocking log thread.
+
+    Flushes and stops the current log thread; the next record starts one
+    with the new settings.
+
+    Args:
+        queue_size: Maximum number of queued records (default: 10000)
+        overflow_policy: 'block', 'drop_oldest' or 'drop_debug', as for
+            setup_production_logging (default: 'drop_oldest'). Records
+            logged on an event-loop thread never wait for room: where the
+            policy would block, the oldest queued record is dropped instead
+
+    Raises:
+        ValueError: If queue_size < 1 or overflow_policy is not a known value
+    """
+    global NONBLOCKING_LOG_QUEUE_SIZE, NONBLOCKING_LOG_OVERFLOW_POLICY
+    from libs.logging_utils import OVERFLOW_POLICIES
+    if queue_size < 1:
+        raise ValueError(f"queue_size must be >= 1, got {queue_size}")
+    if overflow_policy not in OVERFLOW_POLICIES:
+        raise ValueError(f"overflow_policy must be one of {OVERFLOW_POLICIES}, got {overflow_policy!r}")
+    stop_nonblocking_logging()
+    NONBLOCKING_LOG_QUEUE_SIZE = queue_size
+    NONBLOCKING_LOG_OVERFLOW_POLICY = overflow_policy
+
+def get_nonblocking_dropped_counts() -> Dict[str, int]:
+    """
+    Get the number of records the non-blocking log queue dropped, per level.
+
+    Returns:
+        Dict[str, int]: Drop counters of the current log thread keyed by level
+        name (empty when nothing was dropped or no thread is running)
+    """
+    pipeline = _log_pipeline
+    if pipeline is None:
+        return {}
+    queue_handler = pipeline[0]
+    with queue_handler._dropped_lock:
+        return dict(queue_handler.dropped)
+
+class NonBlockingLogger:
+    """
+    Logger facade for coroutines that never runs handlers on the calling thread.
+
+    The level check and record creation happen on the caller's thread, so a
+    disabled level costs the same as with a plain logger and records keep
+    the caller's file, line, thread and context variables. The message is
+    merged with its arguments on the caller's thread too, like QueueHandler
+    does, so later changes to mutable arguments do not show up. Filtering,
+    formatting and I/O happen on a shared background thread, in the order
+    the records were logged. The queue in between is bounded and never
+    blocks an event loop; see configure_nonblocking_logging.
+
+    Args:
+        logger: Logger whose configuration (level, handlers, propagation) applies
+
+    Example:
+        >>> log = get_nonblocking_logger(logging.getLogger(__name__))
+        >>> log.info("Processed %d chunks", 12)
+    """
+    __slots__ = ('logger',)
+
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+
+    @property
+    def name(self) -> str:
+        return self.logger.name
+
+    def isEnabledFor(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
+
+    def _log(self, level: int, msg: str, args: tuple, exc_info: Any = None, extra: Optional[dict] = None) -> None:
+        # Caller of debug()/info()/... is two frames up
+        frame = sys._getframe(2)
+        if exc_info:
+            if isinstance(exc_info, BaseException):
+                exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+            elif not isinstance(exc_info, tuple):
+                exc_info = sys.exc_info()
+        record = self.logger.makeRecord(self.logger.name, level, frame.f_code.co_filename, frame.f_lineno,
+                                        msg, args, exc_info, frame.f_code.co_name, extra)
+        global _log_producers
+        asyncio = sys.modules.get('asyncio')
+        on_loop = asyncio is not None and asyncio._get_running_loop() is not None
+        with _log_lock:
+            queue_handler = _log_pipeline[0] if _log_pipeline else _start_log_thread()
+            _log_producers += 1
+        try:
+            record = queue_handler.prepare(record)
+            record._nonblocking_target = (contextvars.copy_context(), self.logger)
+            queue_handler.enqueue(record, wait=not on_loop)
+        finally:
+            with _log_lock:
+                _log_producers -= 1
+                if not _log_producers:
+                    _log_idle.notify_all()
+
+    def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, msg, args, **kwargs)
+
+    def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, msg, args, **kwargs)
+
+    def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, msg, args, **kwargs)
+
+    def error(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, msg, args, **kwargs)
+
+    def exception(self, msg: str, *args: Any, exc_info: Any = True, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, msg, args, exc_info=exc_info, **kwargs)
+
+_nonblocking_loggers: Dict[str, NonBlockingLogger] = {}
+
+def get_nonblocking_logger(logger_or_name: Union[logging.Logger, str]) -> NonBlockingLogger:
+    """
+    Return the shared NonBlockingLogger for a logger or logger name.
+
+    Args:
+        logger_or_name: Logger to wrap, or the name passed to logging.getLogger
+
+    Returns:
+        NonBlockingLogger: Cached facade, one per logger name
+    """
+    name = logger_or_name if isinstance(logger_or_name, str) else logger_or_name.name
+    facade = _nonblocking_loggers.get(name)
+    if facade is None:
+        target = logging.getLogger(name) if isinstance(logger_or_name, str) else logger_or_name
+        facade = _nonblocking_loggers.setdefault(name, NonBlockingLogger(target))
+    return facade
+
+if __name__ == "__main__":
+    import asyncio
+    import time
+
+    logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(threadName)s - %(name)s - %(levelname)s - %(message)s')
+
+    print("Testing async_utils functions...")
+
+    async def main():
+        # Test 1: Offloaded calls return results and propagate exceptions
+        print(f"Test 1 Result: offload(sum) = {await offload(sum, range(1000))}")
+        try:
+            await offload(int, "not a number")
+        except ValueError as e:
+            print(f"Test 1 Result: exception propagated - {e}")
+
+        # Test 2: Concurrency is bounded while the loop keeps ticking
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.001)
+                ticks += 1
+
+        tick_task = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        await asyncio.gather(*(offload(time.sleep, 0.05) for _ in range(ASYNC_OFFLOAD_WORKERS * 2)))
+        elapsed = time.perf_counter() - start
+        tick_task.cancel()
+        print(f"Test 2 Result: {ASYNC_OFFLOAD_WORKERS * 2} x 50ms sleeps on {ASYNC_OFFLOAD_WORKERS} workers "
+              f"took {elapsed * 1000:.0f}ms, loop ticked {ticks} times meanwhile")
+
+        # Test 3: Log records are handled off the loop thread
+        get_nonblocking_logger(logger).info("Test 3 Result: logged from the loop, handled on %s",
+                                            "the nonblocking-log thread")
+
+    asyncio.run(main())
+    stop_nonblocking_logging()
+
+    # Test 4: A slow sink cannot grow the queue beyond its bound
+    class SlowHandler(logging.Handler):
+        def emit(self, record):
+            time.sleep(0.001)
+
+    slow_logger = logging.getLogger(f"{__name__}.slow")
+    slow_logger.propagate = False
+    slow_logger.addHandler(SlowHandler())
+    configure_nonblocking_logging(queue_size=8, overflow_policy='drop_oldest')
+    for i in range(500):
+        get_nonblocking_logger(slow_logger).info("Record %d", i)
+    dropped = get_nonblocking_dropped_counts()
+    stop_nonblocking_logging()
+    print(f"Test 4 Result: 500 records into a queue of 8 behind a slow sink, dropped {dropped}")
+
+    # Test 5: Even the 'block' policy does not block an event loop, and arguments are merged when logged
+    class CollectingHandler(logging.Handler):
+        def __init__(self):
+            super().__init__()
+            self.messages = []
+
+        def emit(self, record):
+            time.sleep(0.001)
+            self.messages.append(record.getMessage())
+
+    collecting = CollectingHandler()
+    slow_logger.removeHandler(slow_logger.handlers[0])
+    slow_logger.addHandler(collecting)
+    configure_nonblocking_logging(queue_size=8, overflow_policy='block')
+
+    async def log_burst():
+        items = [1]
+        get_nonblocking_logger(slow_logger).info("Items %s", items)
+        items.append(2)
+        await asyncio.sleep(0.05)
+        start = time.perf_counter()
+        for i in range(500):
+            get_nonblocking_logger(slow_logger).info("Record %d", i)
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(log_burst())
+    dropped = get_nonblocking_dropped_counts()
+    stop_nonblocking_logging()
+    assert collecting.messages[0] == "Items [1]", collecting.messages[0]
+    print(f"Test 5 Result: 500 records with policy 'block' on the loop took {elapsed * 1000:.0f}ms "
+          f"(sink needs ~500ms), dropped {dropped}")
+    configure_nonblocking_logging()
+    print("Module testing completed")
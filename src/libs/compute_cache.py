@@ -0,0 +1,314 @@
+"""Content-addressed result cache shared by the Streamlit demo apps.
+
+Streamlit re-executes the whole app script on every widget interaction, so
+without a cache every rerun repeats the same analysis and logging for inputs
+that have not changed. This module provides a bounded, thread-safe LRU cache
+with a time-to-live whose keys are content hashes of the call arguments, so
+the same text or numbers hit the cache across reruns and sessions of the
+same server process. Hit/miss counters are kept for display in the UI.
+
+Features:
+    - Content-hash keys (BLAKE2b) over str, bytes, arrays and containers
+    - Bounded LRU eviction with a per-entry time-to-live
+    - Hit, miss, eviction and expiry counters with a snapshot API
+    - Decorator to cache any pure function
+
+Example:
+    >>> from libs.compute_cache import get_compute_cache
+    >>> cache = get_compute_cache()
+    >>> cached_len = cache.cached(len)
+    >>> cached_len("some text"), cached_len("some text")
+    (9, 9)
+    >>> cache.stats().hits
+    1
+"""
+
+import functools
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+# Configure module-level logger - NO handlers, NO setLevel
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Defaults for the process-wide cache: entries kept and seconds each stays valid
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_CACHE_TTL = 600.0
+
+T = TypeVar("T")
+
+def _feed(h: "hashlib._Hash", value: Any) -> None:
+    """Feed a type-tagged, length-prefixed encoding of value into the hash."""
+    if isinstance(value, str):
+        data = value.encode("utf-8", "surrogatepass")
+        h.update(b"s" + len(data).to_bytes(8, "little"))
+        h.update(data)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        data = memoryview(value).cast("B")
+        h.update(b"b" + data.nbytes.to_bytes(8, "little"))
+        h.update(data)
+    elif isinstance(value, (list, tuple)):
+        h.update((b"l" if isinstance(value, list) else b"t") + len(value).to_bytes(8, "little"))
+        for item in value:
+            _feed(h, item)
+    elif isinstance(value, dict):
+        h.update(b"d" + len(value).to_bytes(8, "little"))
+        for key, item in value.items():
+            _feed(h, key)
+            _feed(h, item)
+    elif value is None or isinstance(value, (bool, int, float, complex)):
+        # Scalar reprs are exact and never abbreviated
+        h.update(b"n" + repr(value).encode() + b"\0")
+    elif hasattr(value, "to_numpy") and hasattr(value, "index"):
+        # pandas Series/DataFrame: index, column labels and each column's values
+        h.update(f"p{type(value).__name__}".encode())
+        _feed(h, _pandas_values(value.index))
+        if hasattr(value, "columns"):
+            _feed(h, _pandas_values(value.columns))
+            for _, column in value.items():
+                _feed(h, _pandas_values(column))
+        else:
+            _feed(h, _pandas_values(value))
+    elif hasattr(value, "dtype") and hasattr(value, "tobytes"):
+        # Object arrays hold pointers, whose bytes say nothing about the content
+        if value.dtype.hasobject:
+            raise TypeError("Cannot hash object-dtype arrays by content")
+        # NumPy arrays: hash the buffer in place when it is contiguous
+        h.update(f"a{value.dtype.str}{value.shape}".encode())
+        try:
+            h.update(memoryview(value).cast("B"))
+        except (TypeError, ValueError):
+            h.update(value.tobytes())
+    else:
+        raise TypeError(f"Cannot hash {type(value).__name__} values by content")
+
+def _pandas_values(obj: Any) -> Any:
+    """Return the values of a pandas Series or Index as an array, or as a list of Python objects (e.g. strings)."""
+    values = obj.to_numpy()
+    return values.tolist() if values.dtype.hasobject else values
+
+def content_hash(*args: Any, **kwargs: Any) -> str:
+    """Return a hex digest identifying the content of the given arguments.
+
+    Equal strings, byte strings, numbers, NumPy arrays, pandas Series and
+    DataFrames, and (nested) lists, tuples and dicts of them hash equally
+    regardless of object identity.
+
+    Args:
+        *args: Positional values to hash
+        **kwargs: Keyword values to hash, in sorted key order
+
+    Returns:
+        32-character hex digest
+
+    Raises:
+        TypeError: For values whose content cannot be hashed, such as
+            object-dtype arrays or arbitrary objects
+
+    Example:
+        >>> content_hash("abc") == content_hash("".join(["a", "bc"]))
+        True
+    """
+    h = hashlib.blake2b(digest_size=16)
+    _feed(h, args)
+    if kwargs:
+        _feed(h, sorted(kwargs.items()))
+    return h.hexdigest()
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time counters of a ComputeCache."""
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+class ComputeCache:
+    """Bounded LRU cache with per-entry time-to-live and hit/miss counters.
+
+    Lookups and updates take a single lock; the cached computation itself
+    runs outside it, so two threads missing on the same key at once may both
+    compute it and the later result is kept. Cached values are shared between
+    callers and should be treated as read-only.
+
+    Args:
+        maxsize: Maximum number of entries before the least recently used is evicted
+        ttl: Seconds an entry stays valid, or None to keep entries until evicted
+
+    Example:
+        >>> cache = ComputeCache(maxsize=2, ttl=None)
+        >>> cache.get_or_compute("k", lambda: 1)
+        1
+        >>> cache.get_or_compute("k", lambda: 2)
+        1
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, ttl: Optional[float] = DEFAULT_CACHE_TTL):
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive or None")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get_or_compute(self, key: str, compute: Callable[[], T]) -> T:
+        """Return the cached value for key, calling compute() on a miss.
+
+        Exceptions raised by compute() propagate and nothing is cached.
+
+        Args:
+            key: Cache key, typically from content_hash()
+            compute: Zero-argument callable producing the value
+
+        Returns:
+            The cached or freshly computed value
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    logger.debug("Cache hit for key %s", key)
+                    return entry[1]
+                del self._entries[key]
+                self._expirations += 1
+            self._misses += 1
+
+        logger.debug("Cache miss for key %s", key)
+        value = compute()
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return value
+
+    def cached(self, func: Callable[..., T]) -> Callable[..., T]:
+        """Wrap a pure function so calls are served from this cache.
+
+        The key combines the function's qualified name with the content hash
+        of its arguments.
+
+        Args:
+            func: Function whose result depends only on its arguments
+
+        Returns:
+            Wrapper with the same signature as func
+        """
+        prefix = f"{func.__module__}.{func.__qualname__}:"
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            key = prefix + content_hash(*args, **kwargs)
+            return self.get_or_compute(key, lambda: func(*args, **kwargs))
+
+        wrapper.cache = self
+        return wrapper
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, self._expirations,
+                              len(self._entries), self.maxsize)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+_default_cache: Optional[ComputeCache] = None
+_default_cache_lock = threading.Lock()
+
+def get_compute_cache() -> ComputeCache:
+    """Return the process-wide cache shared by all app sessions.
+
+    Streamlit imports modules once per server process, so this instance
+    persists across script reruns and browser sessions.
+
+    Returns:
+        The shared ComputeCache, created on first use with default limits
+    """
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = ComputeCache()
+    return _default_cache
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    print("Testing compute_cache functions...")
+
+    # Test 1: Equal content gives equal keys, different types do not collide
+    assert content_hash("abc") == content_hash("".join(["a", "bc"]))
+    assert content_hash("1") != content_hash(1) != content_hash(b"1")
+    assert content_hash(["a", "b"]) != content_hash(["ab"])
+    print("Test 1 Result: content_hash distinguishes content and type")
+
+    # Test 1b: Long pandas objects hash their full content, unhashable values are refused
+    import numpy as np
+    import pandas as pd
+    series = pd.Series(np.arange(10_000.0))
+    changed = series.copy()
+    changed[5_000] = -1.0
+    assert repr(series) == repr(changed) and content_hash(series) != content_hash(changed)
+    frame = pd.DataFrame({"a": np.arange(3), "b": ["x", "y", "z"]}, index=["r1", "r2", "r3"])
+    assert content_hash(frame) != content_hash(frame.rename(index={"r3": "r4"}))
+    for unhashable in (np.array(["x", None], dtype=object), object()):
+        try:
+            content_hash(unhashable)
+        except TypeError as e:
+            print(f"Test 1b Result: refused - {e}")
+
+    # Test 2: Hits, misses and LRU eviction
+    cache = ComputeCache(maxsize=2, ttl=None)
+    calls = []
+    square = cache.cached(lambda x: calls.append(x) or x * x)
+    results = [square(2), square(2), square(3), square(4), square(2)]
+    print(f"Test 2 Result: results={results}, computed={calls}, stats={cache.stats()}")
+
+    # Test 3: Entries expire after the time-to-live
+    cache = ComputeCache(maxsize=4, ttl=0.05)
+    cache.get_or_compute("k", lambda: "first")
+    time.sleep(0.1)
+    value = cache.get_or_compute("k", lambda: "second")
+    print(f"Test 3 Result: after ttl value={value!r}, expirations={cache.stats().expirations}")
+
+    # Test 4: Concurrent callers share the cache safely
+    cache = ComputeCache(maxsize=64, ttl=None)
+    threads = [threading.Thread(target=lambda: [cache.get_or_compute(str(i % 16), lambda: i) for i in range(1000)])
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = cache.stats()
+    print(f"Test 4 Result: lookups={stats.hits + stats.misses}, size={stats.size}, hit_rate={stats.hit_rate:.3f}")
+
+    print("Module testing completed")
@@ -1,4 +1,3 @@
-
 """Example module demonstrating package-based imports.
 
 This module is part of the libs package and shows how to organize
@@ -20,11 +19,28 @@ Example:
 """
 
 import logging
+import math
+import os
+import sys
+import threading
+from collections.abc import AsyncIterable, Iterable, Iterator, Mapping
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from libs.instrumentation import instrument
+
+# NumPy and the executors are imported on first use, so summing a list
+# (e.g. in a short-lived CLI job) never pays for them at startup
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    import numpy as np
 
 # Configure module-level logger - NO handlers, NO setLevel
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+@instrument
 def import_checking1(test_str: str) -> str:
     """Check if package import is working correctly.
     
@@ -41,45 +57,439 @@ def import_checking1(test_str: str) -> str:
         >>> import_checking1("Hello World!")
         'Import import_checking1 successful, and here is your input: Hello World!'
     """
-    logger.info(f"Processing import check with input: {test_str[:50]}...")
+    logger.info("Processing import check with input: %.50s...", test_str)
     result = f"Import import_checking1 successful, and here is your input: {test_str}"
-    logger.debug(f"Generated result: {result[:100]}...")
+    logger.debug("Generated result: %.100s...", result)
     return result
 
-def calculate_sum(numbers: list[float]) -> float:
-    """Calculate the sum of a list of numbers.
+# Items pulled from an iterator per vectorized reduction on the streaming path
+STREAM_CHUNK_SIZE = 65536
+
+# Minimum input sizes for a parallel reduction. NumPy chunks run on threads
+# (the reduction releases the GIL); Python sequences need a process pool,
+# whose pickling cost usually exceeds the builtin sum itself, so that path
+# is only taken when workers is passed explicitly.
+PARALLEL_THRESHOLD = 2_000_000
+PROCESS_PARALLEL_THRESHOLD = 10_000_000
+
+# Smallest chunk worth handing to a worker
+MIN_ITEMS_PER_WORKER = 500_000
+
+# Summation modes: vectorized pairwise, Kahan-Neumaier compensated, correctly rounded
+PRECISION_MODES = ('fast', 'compensated', 'exact')
+
+# Items per vectorized TwoSum pass in 'compensated' mode (bounds temporary memory)
+COMPENSATED_BLOCK_SIZE = 1 << 18
+
+# Shared pools, keyed by (kind, workers), created on first use (also used by process_texts)
+_executors: dict = {}
+_executors_lock = threading.Lock()
+
+def _get_executor(kind: str, workers: int) -> "Executor":
+    """Return the shared thread or process pool for the given worker count."""
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    with _executors_lock:
+        executor = _executors.get((kind, workers))
+        if executor is None:
+            if kind == 'thread':
+                executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='calculate_sum')
+            else:
+                executor = ProcessPoolExecutor(max_workers=workers)
+            _executors[(kind, workers)] = executor
+        return executor
+
+def _resolve_workers(count: int, workers: Optional[int], threshold: int, auto: bool = True) -> int:
+    """Crossover heuristic: how many workers a reduction of count items should use."""
+    if count < threshold or workers == 1 or (workers is None and not auto):
+        return 1
+    limit = workers if workers is not None else (os.cpu_count() or 1)
+    return max(1, min(limit, count // MIN_ITEMS_PER_WORKER))
+
+def _chunk_bounds(count: int, n_chunks: int) -> list[tuple[int, int]]:
+    step = -(-count // n_chunks)
+    return [(start, min(start + step, count)) for start in range(0, count, step)]
+
+def _neumaier_add(total: float, comp: float, value: float) -> tuple[float, float]:
+    """One Kahan-Neumaier step: add value to (total, compensation)."""
+    t = total + value
+    if abs(total) >= abs(value):
+        comp += (total - t) + value
+    else:
+        comp += (value - t) + total
+    return t, comp
+
+def _combine_partials(partials: Iterable[tuple[float, float]], precision: str) -> float:
+    """Add (sum, compensation) partials: plainly in 'fast' mode, Neumaier-compensated otherwise."""
+    if precision == 'fast':
+        return float(sum(s for s, _ in partials))
+    total = comp = 0.0
+    for s, e in partials:
+        total, comp = _neumaier_add(total, comp, s)
+        comp += e
+    # An inf or nan partial turns the compensation into nan; the plain total is already the answer
+    return total + comp if math.isfinite(total) else total
+
+def _compensated_partial(block: "np.ndarray") -> tuple[float, float]:
+    """Pairwise-sum a float block, collecting every rounding error with a vectorized TwoSum.
+
+    If the pairwise sum is not finite (inf/nan input, or overflow), the
+    errors are meaningless and the block is summed again left to right,
+    like the builtin sum, so overflow gives inf rather than inf - inf = nan.
+    """
+    import numpy as np
+    err = 0.0
+    x = block
+    # Overflowing pairs are expected here and handled below, so NumPy must not warn about them
+    with np.errstate(over='ignore', invalid='ignore'):
+        while x.size > 1:
+            even = x.size - x.size % 2
+            a = x[0:even:2]
+            b = x[1::2]
+            s = a + b
+            b_virtual = s - a
+            err += float(np.add.reduce((a - (s - b_virtual)) + (b - b_virtual)))
+            x = s if even == x.size else np.concatenate((s, x[-1:]))
+        total = float(x[0]) if x.size else 0.0
+        if not math.isfinite(total):
+            # np.add.reduce is pairwise too; cumsum adds strictly in order
+            return float(np.cumsum(block)[-1]), 0.0
+    return total, err
+
+def _strict_float(value: Any) -> float:
+    """float() that, like the builtin sum, refuses strings instead of parsing them."""
+    if isinstance(value, (str, bytes, bytearray)):
+        raise TypeError(f"Cannot sum {type(value).__name__} values")
+    return float(value)
+
+def _items_array(items: Union[list, tuple]) -> "np.ndarray":
+    """1-D array of a list of numbers; nested sequences are refused, as in the builtin sum."""
+    import numpy as np
+    # np.array keeps strings as strings, so they are rejected like in the builtin sum
+    array = np.array(items)
+    if array.ndim != 1:
+        raise ValueError(f"Cannot sum nested sequences (items form an array of shape {array.shape})")
+    return array
+
+def _block_partial(block: "np.ndarray", precision: str) -> tuple[float, float]:
+    """Reduce a 1-D block to a (sum, compensation) partial for 'fast' or 'compensated'."""
+    import numpy as np
+    kind = block.dtype.kind
+    if kind == 'O':
+        values = block.tolist()
+        if precision == 'fast':
+            # Object/decimal arrays: same semantics as the builtin sum
+            return float(sum(values)), 0.0
+        block = np.array([_strict_float(value) for value in values], dtype=np.float64)
+    elif kind not in 'biuf':
+        raise TypeError(f"Cannot sum array of dtype {block.dtype}")
+    if precision == 'fast':
+        return float(np.add.reduce(block, dtype=np.float64)), 0.0
+    total = comp = 0.0
+    for start in range(0, max(block.size, 1), COMPENSATED_BLOCK_SIZE):
+        s, e = _compensated_partial(block[start:start + COMPENSATED_BLOCK_SIZE].astype(np.float64, copy=False))
+        total, comp = _neumaier_add(total, comp, s)
+        comp += e
+    return total, comp
+
+def _sum_array_chunk(array: "np.ndarray", start: int, stop: int, precision: str) -> tuple[float, float]:
+    return _block_partial(array[start:stop], precision)
+
+def _sum_sequence_chunk(chunk: list) -> Any:
+    # Runs in a worker process; returns the exact partial sum (ints stay ints)
+    return sum(chunk)
+
+def _as_numeric_array(numbers: Any) -> Optional["np.ndarray"]:
+    """Return a zero-copy NumPy view of array-like or buffer input, or None."""
+    if hasattr(numbers, '__array__'):
+        import numpy as np
+        # pandas Series/Index and other NumPy-backed containers are viewed as arrays
+        return numbers if isinstance(numbers, np.ndarray) else np.asarray(numbers)
+    try:
+        view = memoryview(numbers)
+    except TypeError:
+        return None
+    import numpy as np
+    return np.asarray(view)
+
+def _sum_array(array: "np.ndarray", workers: int = 1, precision: str = 'fast') -> float:
+    """Reduce a NumPy array in a single pass, optionally on threads."""
+    flat = array.reshape(-1)
+    if precision == 'exact':
+        blocks = (flat[start:start + STREAM_CHUNK_SIZE].tolist() for start in range(0, flat.size, STREAM_CHUNK_SIZE))
+        return math.fsum(chain.from_iterable(blocks))
+    if workers > 1 and flat.dtype.kind in 'biuf':
+        executor = _get_executor('thread', workers)
+        futures = [executor.submit(_sum_array_chunk, flat, start, stop, precision)
+                   for start, stop in _chunk_bounds(flat.size, workers)]
+        partials = [future.result() for future in futures]
+    else:
+        partials = [_block_partial(flat, precision)]
+    return _combine_partials(partials, precision)
+
+def _sum_stream(iterator: Iterator, chunk_size: int, precision: str = 'fast') -> tuple[float, int]:
+    """Sum an iterator chunk by chunk without materializing it; returns (sum, count)."""
+    count = 0
+    
+    def chunks():
+        nonlocal count
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            count += len(chunk)
+            yield chunk
+    
+    if precision == 'exact':
+        return math.fsum(chain.from_iterable(chunks())), count
+    partials = (_block_partial(_items_array(chunk), precision) for chunk in chunks())
+    return _combine_partials(partials, precision), count
+
+def _sum_sequence(numbers: Union[list, tuple], workers: int = 1, precision: str = 'fast',
+                  chunk_size: int = STREAM_CHUNK_SIZE) -> float:
+    """Sum a list/tuple; 'fast' uses the builtin sum, optionally across worker processes."""
+    if precision == 'exact':
+        return math.fsum(numbers)
+    if precision == 'compensated':
+        if sys.version_info >= (3, 12):
+            # The builtin sum is Neumaier-compensated for floats since 3.12
+            return float(sum(numbers))
+        return _sum_stream(iter(numbers), chunk_size, precision)[0]
+    if workers > 1:
+        executor = _get_executor('process', workers)
+        chunks = (numbers[start:stop] for start, stop in _chunk_bounds(len(numbers), workers))
+        return float(sum(executor.map(_sum_sequence_chunk, chunks)))
+    return float(sum(numbers))
+
+@instrument
+def calculate_sum(numbers: Union[Iterable[float], "np.ndarray"], chunk_size: int = STREAM_CHUNK_SIZE,
+                  workers: Optional[int] = None, parallel_threshold: Optional[int] = None,
+                  precision: str = 'fast') -> float:
+    """Calculate the sum of a collection of numbers.
+    
+    Lists and tuples are summed with the builtin sum. NumPy arrays, pandas
+    Series and other buffer-protocol objects (``array.array``, ``memoryview``)
+    are reduced in place with a vectorized float64 sum, without copying.
+    Any other iterable, including generators, is consumed in chunks of
+    ``chunk_size`` items so it is never materialized as a whole.
+    
+    Inputs of at least ``parallel_threshold`` items are split into chunks
+    reduced in parallel: on a thread pool for NumPy data (the reduction
+    releases the GIL) and on a process pool for lists and tuples. The
+    partial sums are then combined. Lists and tuples only use processes
+    when ``workers`` is given, since shipping the chunks to the workers
+    costs more than the sum for most inputs.
+    
+    ``precision`` trades speed for accuracy, always in a single pass:
+    
+    - ``fast``: vectorized pairwise sum (builtin sum for lists)
+    - ``compensated``: Kahan-Neumaier; every rounding error of a vectorized
+      pairwise sum is recovered with TwoSum and added back
+    - ``exact``: correctly rounded ``math.fsum`` (never parallel)
     
     Args:
-        numbers: List of numbers to sum
+        numbers: List, array, buffer or iterable of numbers to sum
+        chunk_size: Items per vectorized chunk on the streaming path
+            (default: STREAM_CHUNK_SIZE)
+        workers: Maximum parallel workers; None picks one per CPU above the
+            threshold for NumPy data, 1 forces a single-threaded sum (default: None)
+        parallel_threshold: Minimum size for a parallel reduction (default:
+            PARALLEL_THRESHOLD for arrays, PROCESS_PARALLEL_THRESHOLD for lists)
+        precision: One of PRECISION_MODES (default: 'fast')
         
     Returns:
-        The sum of all numbers in the list
+        The sum of all numbers
         
     Raises:
-        TypeError: If input is not a list
-        ValueError: If list contains non-numeric values
+        TypeError: If input is a string, mapping or not iterable
+        ValueError: If input contains non-numeric values, workers < 1 or
+            precision is unknown
         
     Example:
         >>> calculate_sum([1, 2, 3, 4, 5])
         15.0
+        >>> calculate_sum(x * 0.5 for x in range(4))
+        3.0
+        >>> calculate_sum(np.ones(10_000_000), workers=4)
+        10000000.0
+        >>> calculate_sum([1e16, 1.0, -1e16], precision='exact')
+        1.0
     """
-    logger.debug(f"Calculating sum for {len(numbers) if isinstance(numbers, list) else 'non-list'} items")
-    
-    if not isinstance(numbers, list):
-        logger.error("Input validation failed: input is not a list")
-        raise TypeError("Input must be a list")
+    if isinstance(numbers, (str, bytes, bytearray, Mapping)) or not (
+            isinstance(numbers, Iterable) or hasattr(numbers, '__array__')):
+        logger.error("Input validation failed: input is not a list, array or iterable")
+        raise TypeError("Input must be a list, array or iterable of numbers")
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    if precision not in PRECISION_MODES:
+        raise ValueError(f"precision must be one of {PRECISION_MODES}, got {precision!r}")
     
     try:
-        result = float(sum(numbers))
-        logger.info(f"Sum calculation completed: {len(numbers)} numbers, result={result}")
+        if isinstance(numbers, (list, tuple)):
+            count = len(numbers)
+            threshold = PROCESS_PARALLEL_THRESHOLD if parallel_threshold is None else parallel_threshold
+            n_workers = _resolve_workers(count, workers, threshold, auto=False)
+            logger.debug("Calculating %s sum for %d items (workers=%d)", precision, count, n_workers)
+            result = _sum_sequence(numbers, n_workers, precision, chunk_size)
+        else:
+            array = _as_numeric_array(numbers)
+            if array is not None:
+                count = array.size
+                threshold = PARALLEL_THRESHOLD if parallel_threshold is None else parallel_threshold
+                n_workers = _resolve_workers(count, workers, threshold)
+                logger.debug("Calculating vectorized %s sum for %d items (dtype=%s, workers=%d)",
+                             precision, count, array.dtype, n_workers)
+                result = _sum_array(array, n_workers, precision)
+            else:
+                logger.debug("Calculating streaming %s sum in chunks of %d items", precision, chunk_size)
+                result, count = _sum_stream(iter(numbers), chunk_size, precision)
+        logger.info("Sum calculation completed: %d numbers, result=%s", count, result)
         return result
     except (TypeError, ValueError) as e:
-        logger.error(f"Sum calculation failed: {e}")
+        logger.error("Sum calculation failed: %s", e)
         raise ValueError("All items in list must be numeric") from e
 
+def _exact_partials(values: list) -> list:
+    """Return non-overlapping floats whose exact sum is the exact sum of values (values is extended)."""
+    partials = []
+    while True:
+        total = math.fsum(values)
+        if total == 0.0:
+            return partials
+        partials.append(total)
+        if not math.isfinite(total):
+            return partials
+        # fsum is correctly rounded, so each round leaves only the rounding error
+        values.append(-total)
+
+def _is_number_chunk(item: Any) -> bool:
+    """True for chunk items of an async stream (sequences, arrays, buffers), False for single numbers."""
+    if isinstance(item, (list, tuple, memoryview)):
+        return True
+    return hasattr(item, '__array__') and getattr(item, 'ndim', 0) > 0
+
+def _chunk_partial(chunk: Any, precision: str) -> tuple[float, float, int]:
+    """(sum, compensation, count) of one chunk for 'fast' or 'compensated'; safe to run on a worker."""
+    array = _as_numeric_array(chunk)
+    array = _items_array(chunk) if array is None else array.reshape(-1)
+    s, e = _block_partial(array, precision)
+    return s, e, array.size
+
+def _chunk_exact_partials(partials: list, chunk: Any) -> tuple[list, int]:
+    """Fold one chunk into the exact partials of the running sum; returns (partials, count)."""
+    array = _as_numeric_array(chunk)
+    values = array.reshape(-1).tolist() if array is not None else list(chunk)
+    return _exact_partials(partials + values), len(values)
+
+async def _aiter_number_chunks(numbers: Any, chunk_size: int) -> Any:
+    """Normalize an async or sync source of numbers or chunks into an async stream of chunks."""
+    if hasattr(numbers, '__aiter__'):
+        buffer = []
+        async for item in numbers:
+            if _is_number_chunk(item):
+                if buffer:
+                    yield buffer
+                    buffer = []
+                yield item
+            else:
+                buffer.append(item)
+                if len(buffer) >= chunk_size:
+                    yield buffer
+                    buffer = []
+        if buffer:
+            yield buffer
+    elif isinstance(numbers, (list, tuple)) or _as_numeric_array(numbers) is not None:
+        yield numbers
+    else:
+        iterator = iter(numbers)
+        while chunk := list(islice(iterator, chunk_size)):
+            yield chunk
+
+async def calculate_sum_async(numbers: Union[AsyncIterable[Any], Iterable[float], "np.ndarray"],
+                              chunk_size: int = STREAM_CHUNK_SIZE, precision: str = 'fast',
+                              offload_threshold: Optional[int] = None) -> float:
+    """Calculate the sum of numbers without blocking the event loop.
+    
+    ``numbers`` may be an async iterable yielding single numbers, chunks
+    (lists, tuples, NumPy arrays) or a mix of both, or any input accepted by
+    calculate_sum. Single numbers are grouped into chunks of ``chunk_size``.
+    Each chunk is reduced on the loop if it is smaller than
+    ``offload_threshold`` items and on the shared async executor otherwise
+    (see libs.async_utils.offload), and control returns to the loop after
+    every chunk. Partial sums are combined like calculate_sum's streaming
+    path, with the same ``precision`` modes; ``exact`` stays correctly
+    rounded across chunks.
+    
+    Args:
+        numbers: Async iterable of numbers or chunks, or a list, array or iterable
+        chunk_size: Numbers per chunk for single-number streams and iterators
+            (default: STREAM_CHUNK_SIZE)
+        precision: One of PRECISION_MODES (default: 'fast')
+        offload_threshold: Smallest chunk reduced on the executor (default:
+            libs.async_utils.ASYNC_OFFLOAD_THRESHOLD)
+        
+    Returns:
+        The sum of all numbers
+        
+    Raises:
+        TypeError: If input is a string, mapping or neither iterable nor async iterable
+        ValueError: If input contains non-numeric values or precision is unknown
+        
+    Example:
+        >>> async def readings():
+        ...     for batch in ([1.0, 2.0], np.ones(3)):
+        ...         yield batch
+        >>> await calculate_sum_async(readings())
+        6.0
+    """
+    import asyncio
+
+    from libs.async_utils import ASYNC_OFFLOAD_THRESHOLD, get_nonblocking_logger, offload
+    log = get_nonblocking_logger(logger)
+    
+    if isinstance(numbers, (str, bytes, bytearray, Mapping)) or not (
+            hasattr(numbers, '__aiter__') or isinstance(numbers, Iterable) or hasattr(numbers, '__array__')):
+        log.error("Input validation failed: input is not an async iterable, list, array or iterable")
+        raise TypeError("Input must be an async iterable, list, array or iterable of numbers")
+    if precision not in PRECISION_MODES:
+        raise ValueError(f"precision must be one of {PRECISION_MODES}, got {precision!r}")
+    threshold = ASYNC_OFFLOAD_THRESHOLD if offload_threshold is None else offload_threshold
+    
+    partials: list = []
+    count = chunks = offloaded = 0
+    try:
+        async for chunk in _aiter_number_chunks(numbers, chunk_size):
+            large = len(chunk) >= threshold if hasattr(chunk, '__len__') else True
+            if precision == 'exact':
+                if large:
+                    partials, size = await offload(_chunk_exact_partials, partials, chunk)
+                else:
+                    partials, size = _chunk_exact_partials(partials, chunk)
+            else:
+                if large:
+                    s, e, size = await offload(_chunk_partial, chunk, precision)
+                else:
+                    s, e, size = _chunk_partial(chunk, precision)
+                partials.append((s, e))
+            count += size
+            chunks += 1
+            offloaded += large
+            # Let other tasks run between chunks
+            await asyncio.sleep(0)
+    except (TypeError, ValueError) as e:
+        log.error("Async sum calculation failed: %s", e)
+        raise ValueError("All items in list must be numeric") from e
+    
+    result = math.fsum(partials) if precision == 'exact' else _combine_partials(partials, precision)
+    log.info("Async sum calculation completed: %d numbers in %d chunks (%d offloaded), result=%s",
+             count, chunks, offloaded, result)
+    return result
+
 if __name__ == "__main__":
     import sys
     import logging  # Import logging for test execution
+    import warnings
+
+    import numpy as np
     
     # Test-specific logging (terminal only, configurable level)
     logging.basicConfig(
@@ -104,13 +514,106 @@ if __name__ == "__main__":
     sum_result = calculate_sum(test_numbers)
     print(f"Test 2 Result: Sum of {test_numbers} = {sum_result}")
     
+    # Test vectorized (NumPy) and streaming (generator) paths
+    array_result = calculate_sum(np.arange(1_000_000, dtype=np.float64))
+    print(f"Test 2b Result: Vectorized sum of np.arange(1e6) = {array_result}")
+    stream_result = calculate_sum(x * 0.5 for x in range(1_000_000))
+    print(f"Test 2c Result: Streaming sum of generator = {stream_result}")
+    
+    # Test inf and overflow: every path and mode returns inf like the builtin sum, never nan
+    for mode in ('fast', 'compensated'):
+        for values in ([1.0, float('inf')], [1e308, 1e308]):
+            results = [calculate_sum(values, precision=mode), calculate_sum(np.array(values), precision=mode),
+                       calculate_sum((v for v in values), precision=mode)]
+            assert results == [math.inf] * 3, (mode, values, results)
+    print("Test 2d Result: inf and overflowing inputs sum to inf on list, array and stream paths")
+    # Pairs that overflow in opposite directions: the compensated array sum overflows like sum(), quietly
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        overflow_result = calculate_sum(np.array([1e308, 1e308, -1e308, -1e308]), precision='compensated')
+        large_result = calculate_sum(np.array([1e308, 1e308, -1e308, -1e308] * 100_000), precision='compensated')
+    assert overflow_result == large_result == sum([1e308, 1e308, -1e308, -1e308]) == math.inf, \
+        (overflow_result, large_result)
+    print(f"Test 2d Result: compensated sum of [1e308, 1e308, -1e308, -1e308] = {overflow_result}")
+    
     # Test error handling
     try:
         calculate_sum("not a list")
     except TypeError as e:
         print(f"Test 3 Result: Correctly caught error - {e}")
+    # Nested items are not numbers on any path, streamed or not
+    for nested in ([[1, 2], [3, 4]], (x for x in [[1, 2], [3, 4]])):
+        try:
+            calculate_sum(nested)
+            print("Test 3 Result: ✗ nested items summed")
+        except ValueError as e:
+            print(f"Test 3 Result: Correctly rejected nested {type(nested).__name__} - {e}")
+
+    # Test async variant on a mixed stream of numbers and chunks, one chunk offloaded
+    import asyncio
+
+    from libs.async_utils import stop_nonblocking_logging
+
+    async def mixed_stream():
+        for value in (1, 2, 3):
+            yield value
+        yield np.ones(100_000)
+        yield [1e16, 1.0, -1e16]
+
+    async_result = asyncio.run(calculate_sum_async(mixed_stream(), precision='exact'))
+    
+    async def overflowing_stream():
+        yield 1.0
+        yield np.array([1e308, 1e308])
     
+    assert asyncio.run(calculate_sum_async(overflowing_stream())) == math.inf
+    assert asyncio.run(calculate_sum_async(np.array([1.0, np.inf]), precision='compensated')) == math.inf
+    stop_nonblocking_logging()
+    print(f"Test 4 Result: Async exact sum of mixed stream = {async_result}")
+
     print("Module testing completed")
+    
+    # Parallel scaling benchmark: python src/libs/example_module1.py --benchmark
+    if "--benchmark" in sys.argv:
+        import time
+        
+        logging.getLogger().setLevel(logging.WARNING)
+        size = 20_000_000
+        data = np.random.default_rng(0).random(size)
+        data_list = data.tolist()
+        
+        def best_of(func, repeat=3):
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func()
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+        
+        baseline = best_of(lambda: sum(data_list))
+        print(f"\nBenchmark: {size:,} floats on {os.cpu_count()} CPUs")
+        print(f"  builtin sum(list)                : {baseline * 1e3:8.1f} ms (1.0x)")
+        worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+        for n_workers in worker_counts:
+            elapsed = best_of(lambda: calculate_sum(data, workers=n_workers))
+            print(f"  calculate_sum(ndarray, workers={n_workers:<2}): {elapsed * 1e3:8.1f} ms ({baseline / elapsed:.1f}x)")
+        for n_workers in worker_counts:
+            elapsed = best_of(lambda: calculate_sum(data_list, workers=n_workers, parallel_threshold=1), repeat=1)
+            print(f"  calculate_sum(list, workers={n_workers:<2})   : {elapsed * 1e3:8.1f} ms ({baseline / elapsed:.1f}x)")
+        
+        # Precision matrix on ill-conditioned data (magnitudes spanning 1e-8..1e8)
+        rng = np.random.default_rng(1)
+        size = 5_000_000
+        data = rng.standard_normal(size) * 10.0 ** rng.integers(-8, 9, size)
+        data_list = data.tolist()
+        reference = math.fsum(data_list)
+        print(f"\nPrecision matrix: {size:,} ill-conditioned floats (error relative to math.fsum)")
+        print(f"  {'mode':<12} {'input':<8} {'Mitems/s':>10} {'rel. error':>12}")
+        for mode in PRECISION_MODES:
+            for label, values in (("ndarray", data), ("list", data_list)):
+                elapsed = best_of(lambda: calculate_sum(values, precision=mode, workers=1), repeat=2)
+                error = abs(calculate_sum(values, precision=mode, workers=1) - reference) / abs(reference)
+                print(f"  {mode:<12} {label:<8} {size / elapsed / 1e6:10.1f} {error:12.2e}")
 
 def format_message(message: str, prefix: str = "INFO") -> str:
     """Format a message with a prefix.
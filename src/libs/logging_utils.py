@@ -4,15 +4,138 @@ This module provides utilities for enhanced logging functionality,
 including hierarchical logger name generation for function-level tracing.
 """
 
-import inspect
+import atexit
+import contextvars
+import copy
 import logging
-from typing import Optional, Union
+import logging.handlers
+import queue
+import re
+import struct
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from types import CodeType
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional, Union
 from pathlib import Path
 
 # Configure module-level logger - NO handlers, NO setLevel
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# Upper bound on distinct (code, class) pairs kept by the logger resolver
+OBJ_LOGGER_CACHE_SIZE = 1024
+
+@lru_cache(maxsize=OBJ_LOGGER_CACHE_SIZE)
+def _resolve_obj_logger(code: Optional[CodeType], owner: Optional[type], module_name: str,
+                        eliminate_init: bool = False) -> logging.Logger:
+    """
+    Resolve and cache the hierarchical logger for a code object and class.
+
+    The cache key is the code object plus the runtime class, so every
+    (module, class, function) triple pays for name building and the
+    ``logging`` module lock exactly once. A ``None`` code object stands for
+    the class-level logger.
+    """
+    function_name = code.co_name if code is not None else '__init__'
+    if owner is None:
+        logger_name = f"{module_name}.{function_name}"
+    elif code is None or (eliminate_init and function_name == '__init__'):
+        logger_name = f"{module_name}.{owner.__name__}"
+    else:
+        logger_name = f"{module_name}.{owner.__name__}.{function_name}"
+
+    logger.debug("Generated hierarchical logger name: %s", logger_name)
+    return logging.getLogger(logger_name)
+
+def clear_obj_logger_cache() -> None:
+    """
+    Invalidate every logger bound by the hierarchical logger resolver.
+
+    Call this after reconfiguring ``logging.Logger.manager`` (for example in
+    tests that swap the logger class) so stale logger objects are dropped.
+    """
+    _resolve_obj_logger.cache_clear()
+
+def get_obj_logger(func: Callable, owner: Optional[type] = None,
+                   eliminate_init: bool = False) -> logging.Logger:
+    """
+    Get the hierarchical logger for a function without inspecting any frame.
+
+    Args:
+        func: Function (or method) whose logger should be resolved
+        owner: Class the method runs on, or None for a plain function
+        eliminate_init: Name ``__init__`` loggers after the class only
+
+    Returns:
+        logging.Logger: Cached logger with the same name set_logger_w_obj_name() produces
+
+    Example:
+        >>> def process_data(data):
+        ...     pass
+        >>> get_obj_logger(process_data).name
+        '__main__.process_data'
+    """
+    import inspect
+    func = inspect.unwrap(func)
+    return _resolve_obj_logger(func.__code__, owner, func.__module__, eliminate_init)
+
+def obj_logger(func: Callable) -> Callable:
+    """
+    Decorator binding a function-level hierarchical logger once at definition time.
+
+    The logger is stored on the function's ``logger`` attribute, so the
+    decorated function runs unwrapped with zero per-call overhead.
+
+    Example:
+        >>> @obj_logger
+        ... def process_data(data):
+        ...     process_data.logger.info("Processing data")
+        ...     # Logger name: 'my_package.utils.process_data'
+    """
+    func.logger = get_obj_logger(func)
+    return func
+
+class ObjLogger:
+    """
+    Descriptor resolving class- or method-level hierarchical loggers.
+
+    Declared once in the class body, the descriptor binds the logger per
+    runtime class on first access and serves it from the resolver cache
+    afterwards. Subclasses get their own names, exactly like
+    set_logger_w_obj_name() called on a subclass instance.
+
+    Args:
+        method_name: Method to name the logger after, or None for the class logger
+
+    Example:
+        >>> class AnalyticsEngine:
+        ...     logger = ObjLogger()                    # 'my_package.analytics.AnalyticsEngine'
+        ...     query_logger = ObjLogger("run_query")   # 'my_package.analytics.AnalyticsEngine.run_query'
+        ...     def run_query(self, query):
+        ...         self.query_logger.info("Running query")
+    """
+
+    def __init__(self, method_name: Optional[str] = None):
+        self.method_name = method_name
+        self.code: Optional[CodeType] = None
+        self.module_name = __name__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        # The class body is complete here, so the method can be looked up once
+        self.module_name = owner.__module__
+        if self.method_name is not None:
+            import inspect
+            method = inspect.getattr_static(owner, self.method_name)
+            method = inspect.unwrap(getattr(method, '__func__', method))
+            self.code = method.__code__
+
+    def __get__(self, instance: Any, objtype: Optional[type] = None) -> logging.Logger:
+        owner = objtype if instance is None else type(instance)
+        return _resolve_obj_logger(self.code, owner, self.module_name, False)
+
 def set_logger_w_obj_name(eliminate_init: bool = False) -> logging.Logger:
     """
     Generate a hierarchical logger name based on the calling function/method.
@@ -20,6 +143,9 @@ def set_logger_w_obj_name(eliminate_init: bool = False) -> logging.Logger:
     This function creates logger names that follow the pattern:
     - Function: 'module_name.function_name'
     - Method: 'module_name.ClassName.method_name'
+
+    Loggers are cached per (code object, class) by the same resolver used by
+    ObjLogger and obj_logger, so repeated calls only pay for a frame lookup.
     
     Returns:
         logging.Logger: Configured logger instance with hierarchical name
@@ -42,48 +168,1066 @@ def set_logger_w_obj_name(eliminate_init: bool = False) -> logging.Logger:
         - This function must be called directly from the function/method you want to track
         - Logger configuration (handlers, levels) should be done at entry points only
         - Use this for granular debugging in complex workflows
+        - In hot paths prefer ObjLogger or obj_logger, which skip the frame lookup entirely
     """
-    frame = inspect.currentframe().f_back
-    function_name = frame.f_code.co_name
+    frame = sys._getframe(1)
+    code = frame.f_code
     module_name = frame.f_globals['__name__']
     
-    # Check if called from within a class method
-    if 'self' in frame.f_locals:
-        class_name = frame.f_locals['self'].__class__.__name__
-        if eliminate_init and function_name == '__init__':
-            logger_name = f"{module_name}.{class_name}"
+    # Check if called from within a class method; only materialize f_locals
+    # when the code object can actually hold a 'self' or 'cls' name
+    owner = None
+    names = code.co_varnames + code.co_cellvars + code.co_freevars
+    if 'self' in names or 'cls' in names:
+        local_vars = frame.f_locals
+        if 'self' in local_vars:
+            owner = local_vars['self'].__class__
+        elif 'cls' in local_vars:
+            owner = local_vars['cls']
+            eliminate_init = False
+    if owner is None:
+        eliminate_init = False
+
+    return _resolve_obj_logger(code, owner, module_name, eliminate_init)
+
+# Output formats understood by the setup functions
+OUTPUT_FORMATS = ('text', 'json', 'binary')
+
+# LogRecord attributes that are not user-supplied ``extra`` fields
+_RECORD_ATTRS = (frozenset(logging.LogRecord('', 0, '', 0, '', None, None).__dict__)
+                 | {'message', 'asctime', 'log_context'})
+
+def _structured_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    """Collect the fields shared by the JSON and binary formats for a record."""
+    fields = {
+        'ts': record.created,
+        'level': record.levelname,
+        'logger': record.name,
+        'msg': record.getMessage(),
+    }
+    for key, value in record.__dict__.items():
+        if key not in _RECORD_ATTRS:
+            fields[key] = value
+    if record.exc_info and not record.exc_text:
+        record.exc_text = logging.Formatter().formatException(record.exc_info)
+    if record.exc_text:
+        fields['exc'] = record.exc_text
+    return fields
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formatter emitting one compact JSON object per line.
+
+    Each line carries ``ts`` (epoch seconds from ``record.created``),
+    ``level``, ``logger``, ``msg``, any ``extra`` fields and ``exc`` when an
+    exception is attached. No ``asctime`` string is ever built.
+
+    Example:
+        >>> handler = logging.StreamHandler()
+        >>> handler.setFormatter(JsonFormatter())
+        >>> # {"ts":1700000000.123,"level":"INFO","logger":"app","msg":"Started","user":"u1"}
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        import json
+        self._encode = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False, default=str).encode
+
+    def format(self, record: logging.LogRecord) -> str:
+        return self._encode(_structured_fields(record))
+
+def _pack(obj: Any, out: bytearray) -> None:
+    """Append the msgpack encoding of obj to out (unknown types are packed as str)."""
+    if obj is None:
+        out.append(0xc0)
+    elif obj is True:
+        out.append(0xc3)
+    elif obj is False:
+        out.append(0xc2)
+    elif isinstance(obj, int) and -2 ** 63 <= obj < 2 ** 64:
+        if 0 <= obj < 0x80:
+            out.append(obj)
+        elif -32 <= obj < 0:
+            out.append(obj & 0xff)
+        elif obj >= 0:
+            out += b'\xcf' + struct.pack('>Q', obj)
+        else:
+            out += b'\xd3' + struct.pack('>q', obj)
+    elif isinstance(obj, float):
+        out += b'\xcb' + struct.pack('>d', obj)
+    elif isinstance(obj, str):
+        data = obj.encode('utf-8', 'surrogatepass')
+        size = len(data)
+        if size < 32:
+            out.append(0xa0 | size)
+        elif size < 0x100:
+            out += bytes((0xd9, size))
+        elif size < 0x10000:
+            out += b'\xda' + struct.pack('>H', size)
+        else:
+            out += b'\xdb' + struct.pack('>I', size)
+        out += data
+    elif isinstance(obj, (bytes, bytearray)):
+        size = len(obj)
+        if size < 0x100:
+            out += bytes((0xc4, size))
+        elif size < 0x10000:
+            out += b'\xc5' + struct.pack('>H', size)
+        else:
+            out += b'\xc6' + struct.pack('>I', size)
+        out += obj
+    elif isinstance(obj, (list, tuple)):
+        size = len(obj)
+        if size < 16:
+            out.append(0x90 | size)
+        elif size < 0x10000:
+            out += b'\xdc' + struct.pack('>H', size)
         else:
-            logger_name = f"{module_name}.{class_name}.{function_name}"
-    elif 'cls' in frame.f_locals:
-        class_name = frame.f_locals['cls'].__name__
-        logger_name = f"{module_name}.{class_name}.{function_name}"
+            out += b'\xdd' + struct.pack('>I', size)
+        for item in obj:
+            _pack(item, out)
+    elif isinstance(obj, dict):
+        size = len(obj)
+        if size < 16:
+            out.append(0x80 | size)
+        elif size < 0x10000:
+            out += b'\xde' + struct.pack('>H', size)
+        else:
+            out += b'\xdf' + struct.pack('>I', size)
+        for key, value in obj.items():
+            _pack(str(key), out)
+            _pack(value, out)
     else:
-        logger_name = f"{module_name}.{function_name}"
+        _pack(str(obj), out)
 
-    logger.debug(f"Generated hierarchical logger name: {logger_name}")
-    return logging.getLogger(logger_name)
+# Fixed-width msgpack types: code -> (struct format, size)
+_UNPACK_FIXED = {
+    0xca: ('>f', 4), 0xcb: ('>d', 8),
+    0xcc: ('>B', 1), 0xcd: ('>H', 2), 0xce: ('>I', 4), 0xcf: ('>Q', 8),
+    0xd0: ('>b', 1), 0xd1: ('>h', 2), 0xd2: ('>i', 4), 0xd3: ('>q', 8),
+}
+
+# Length-prefixed msgpack types (str8/16/32, bin8/16/32): code -> (length format, size)
+_UNPACK_SIZED = {
+    0xd9: ('>B', 1), 0xda: ('>H', 2), 0xdb: ('>I', 4),
+    0xc4: ('>B', 1), 0xc5: ('>H', 2), 0xc6: ('>I', 4),
+}
+
+def _unpack(buf: bytes, pos: int = 0) -> tuple:
+    """Decode one msgpack value from buf at pos, returning (value, next_pos)."""
+    code = buf[pos]
+    pos += 1
+    if code < 0x80:
+        return code, pos
+    if code >= 0xe0:
+        return code - 0x100, pos
+    if 0xa0 <= code <= 0xbf:
+        end = pos + (code & 0x1f)
+        return buf[pos:end].decode('utf-8', 'surrogatepass'), end
+    if 0x90 <= code <= 0x9f:
+        return _unpack_array(buf, pos, code & 0x0f)
+    if 0x80 <= code <= 0x8f:
+        return _unpack_map(buf, pos, code & 0x0f)
+    if code == 0xc0:
+        return None, pos
+    if code in (0xc2, 0xc3):
+        return code == 0xc3, pos
+    if code in _UNPACK_FIXED:
+        fmt, size = _UNPACK_FIXED[code]
+        return struct.unpack_from(fmt, buf, pos)[0], pos + size
+    if code in _UNPACK_SIZED:
+        fmt, size = _UNPACK_SIZED[code]
+        length = struct.unpack_from(fmt, buf, pos)[0]
+        start = pos + size
+        data = buf[start:start + length]
+        if code >= 0xd9:
+            return data.decode('utf-8', 'surrogatepass'), start + length
+        return bytes(data), start + length
+    if code in (0xdc, 0xdd):
+        fmt, size = ('>H', 2) if code == 0xdc else ('>I', 4)
+        return _unpack_array(buf, pos + size, struct.unpack_from(fmt, buf, pos)[0])
+    if code in (0xde, 0xdf):
+        fmt, size = ('>H', 2) if code == 0xde else ('>I', 4)
+        return _unpack_map(buf, pos + size, struct.unpack_from(fmt, buf, pos)[0])
+    raise ValueError(f"Unsupported msgpack type byte 0x{code:02x} at offset {pos - 1}")
+
+def _unpack_array(buf: bytes, pos: int, size: int) -> tuple:
+    items = []
+    for _ in range(size):
+        item, pos = _unpack(buf, pos)
+        items.append(item)
+    return items, pos
+
+def _unpack_map(buf: bytes, pos: int, size: int) -> tuple:
+    result = {}
+    for _ in range(size):
+        key, pos = _unpack(buf, pos)
+        result[key], pos = _unpack(buf, pos)
+    return result, pos
+
+class BinaryFormatter(JsonFormatter):
+    """
+    Formatter producing length-prefixed, msgpack-encoded records.
+
+    Each record is a 4-byte big-endian length followed by a msgpack map with
+    the same fields as JsonFormatter. Use encode() to get the framed bytes;
+    read_binary_log() streams the records back. format() falls back to the
+    JSON line, for handlers that can only write str.
+
+    Example:
+        >>> frame = BinaryFormatter().encode(logging.makeLogRecord({'msg': 'hi'}))
+        >>> frame[:4]
+        b'\\x00\\x00\\x00I'
+    """
+
+    def encode(self, record: logging.LogRecord) -> bytes:
+        """Encode a record as a length-prefixed msgpack frame."""
+        payload = bytearray(4)
+        _pack(_structured_fields(record), payload)
+        struct.pack_into('>I', payload, 0, len(payload) - 4)
+        return bytes(payload)
+
+class BinaryLogHandler(logging.FileHandler):
+    """
+    FileHandler writing BinaryFormatter frames to a file opened in binary mode.
+
+    Args:
+        filename: Path to the binary log file
+        mode: File open mode, must be binary (default: 'ab')
+
+    Example:
+        >>> handler = BinaryLogHandler("service.logbin")
+        >>> logging.getLogger().addHandler(handler)
+        >>> # Later: for record in read_binary_log("service.logbin"): ...
+    """
+
+    def __init__(self, filename: Union[str, Path], mode: str = 'ab'):
+        super().__init__(filename, mode=mode)
+        self.setFormatter(BinaryFormatter())
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.formatter.encode(record))
+            self.flush()
+        except Exception:
+            self.handleError(record)
+
+def read_binary_log(source: Union[str, Path, BinaryIO]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream records back out of a binary log written by BinaryFormatter.
+
+    Records are decoded one frame at a time, so arbitrarily large (or
+    gzip-rotated, when opened with ``gzip.open``) files use constant memory.
+
+    Args:
+        source: Path to a binary log file or a binary file object
+
+    Yields:
+        Dict[str, Any]: One decoded record (ts, level, logger, msg, extras)
+
+    Raises:
+        ValueError: If the stream ends in the middle of a record
+
+    Example:
+        >>> for record in read_binary_log("/var/log/app/service.log"):
+        ...     print(record['level'], record['msg'])
+    """
+    if isinstance(source, (str, Path)):
+        import gzip
+        opener = gzip.open if str(source).endswith('.gz') else open
+        with opener(source, 'rb') as f:
+            yield from read_binary_log(f)
+        return
+    while True:
+        header = source.read(4)
+        if not header:
+            return
+        if len(header) < 4:
+            raise ValueError("Truncated binary log: incomplete length prefix")
+        (length,) = struct.unpack('>I', header)
+        payload = source.read(length)
+        if len(payload) < length:
+            raise ValueError("Truncated binary log: incomplete record")
+        yield _unpack(payload)[0]
+
+class BatchedRotatingFileHandler(logging.Handler):
+    """
+    File sink that buffers formatted records and writes them in batches.
+
+    Records are written once ``batch_size`` of them are buffered or every
+    ``flush_interval_ms`` milliseconds, whichever comes first, so the cost of
+    a write syscall is shared by a whole batch. The file is rotated by size
+    and/or age into timestamped segments (``service.log.20250101-120000``),
+    which are optionally gzipped on a background thread. Only the newest
+    ``backup_count`` segments are kept. With a BinaryFormatter the file is
+    written in binary mode using its length-prefixed frames.
+
+    Args:
+        filename: Path to the active log file
+        batch_size: Number of buffered records that triggers a write (default: 100)
+        flush_interval_ms: Maximum time a record stays buffered (default: 1000)
+        max_bytes: Rotate before the file would exceed this size, 0 disables (default: 0)
+        rotate_interval: Rotate after this many seconds, 0 disables (default: 0)
+        backup_count: Rotated segments to keep, 0 keeps all (default: 0)
+        compress: Gzip rotated segments in the background (default: False)
+        encoding: File encoding (default: 'utf-8')
+
+    Example:
+        >>> handler = BatchedRotatingFileHandler("service.log", batch_size=500,
+        ...                                      max_bytes=100 * 1024 * 1024,
+        ...                                      backup_count=10, compress=True)
+        >>> logging.getLogger().addHandler(handler)
+    """
+
+    def __init__(self, filename: Union[str, Path], batch_size: int = 100,
+                 flush_interval_ms: int = 1000, max_bytes: int = 0,
+                 rotate_interval: float = 0, backup_count: int = 0,
+                 compress: bool = False, encoding: str = 'utf-8'):
+        super().__init__()
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        self.path = Path(filename).resolve()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compress = compress
+        self.encoding = encoding
+        self._buffer: list = []
+        self._binary = False
+        self._stream = open(self.path, 'a', encoding=encoding)
+        self._size = self._stream.tell()
+        self._opened_at = time.monotonic()
+        from concurrent.futures import ThreadPoolExecutor
+        self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='log-compress')
+        self._stop_event = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name='log-batch-flush', daemon=True)
+        self._flusher.start()
+
+    def setFormatter(self, fmt: Optional[logging.Formatter]) -> None:
+        """Set the formatter, switching the file to binary mode for a BinaryFormatter."""
+        with self.lock:
+            binary = isinstance(fmt, BinaryFormatter)
+            if binary != self._binary:
+                self._write_buffer()
+                self._binary = binary
+                self._stream.close()
+                self._stream = self._open_stream()
+            super().setFormatter(fmt)
+
+    def _open_stream(self):
+        if self._binary:
+            return open(self.path, 'ab')
+        return open(self.path, 'a', encoding=self.encoding)
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self._binary:
+                self._buffer.append(self.formatter.encode(record))
+            else:
+                self._buffer.append(self.format(record) + '\n')
+        except Exception:
+            self.handleError(record)
+            return
+        if len(self._buffer) >= self.batch_size:
+            self._write_buffer()
+
+    def flush(self) -> None:
+        """Write every buffered record to the file."""
+        with self.lock:
+            self._write_buffer()
+
+    def _write_buffer(self) -> None:
+        # Caller holds self.lock
+        if self._stream is None:
+            return
+        if self._buffer:
+            data = (b'' if self._binary else '').join(self._buffer)
+            self._buffer.clear()
+            # max_bytes counts bytes on disk, not characters
+            size = len(data) if self._binary or data.isascii() else len(data.encode(self.encoding))
+            if self._should_rotate(size):
+                self._rotate()
+            try:
+                self._stream.write(data)
+                self._stream.flush()
+            except OSError as e:
+                sys.stderr.write(f"--- Logging error ---\nBatched write to {self.path} failed: {e}\n")
+            self._size += size
+        elif self._should_rotate(0):
+            self._rotate()
+
+    def _should_rotate(self, pending: int) -> bool:
+        if self._size == 0:
+            return False
+        if self.max_bytes and self._size + pending > self.max_bytes:
+            return True
+        return bool(self.rotate_interval) and time.monotonic() - self._opened_at >= self.rotate_interval
+
+    def _rotate(self) -> None:
+        # Caller holds self.lock. Runs inside emit() and on the flush thread, so errors
+        # are reported through handleError and never raised
+        segment = self.path.with_name(f"{self.path.name}.{time.strftime('%Y%m%d-%H%M%S')}")
+        index = 1
+        while segment.exists() or segment.with_name(segment.name + '.gz').exists():
+            segment = self.path.with_name(f"{self.path.name}.{time.strftime('%Y%m%d-%H%M%S')}.{index}")
+            index += 1
+        # The old stream stays open until the new one is, so a failure leaves a working stream
+        try:
+            self.path.rename(segment)
+            stream = self._open_stream()
+        except OSError:
+            self.handleError(logging.makeLogRecord({'msg': f"Rotating {self.path} to {segment.name} failed"}))
+            segment = None
+        else:
+            self._stream.close()
+            self._stream = stream
+        # Also after a failure, so the next attempt waits for another full segment
+        self._size = 0
+        self._opened_at = time.monotonic()
+        if segment is None:
+            return
+        if self.compress:
+            self._compressor.submit(self._compress_segment, segment)
+        else:
+            self._prune_segments()
+
+    def _compress_segment(self, segment: Path) -> None:
+        import gzip
+        import shutil
+        try:
+            with open(segment, 'rb') as src, gzip.open(segment.with_name(segment.name + '.gz'), 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            segment.unlink()
+        except OSError as e:
+            sys.stderr.write(f"--- Logging error ---\nCompressing {segment} failed: {e}\n")
+        self._prune_segments()
+
+    def _prune_segments(self) -> None:
+        if not self.backup_count:
+            return
+        # Only segments written by _rotate: name.YYYYmmdd-HHMMSS[.N][.gz]
+        pattern = re.compile(rf"{re.escape(self.path.name)}\.\d{{8}}-\d{{6}}(\.\d+)?(\.gz)?")
+        segments = sorted((path for path in self.path.parent.iterdir() if pattern.fullmatch(path.name)),
+                          key=lambda p: p.stat().st_mtime)
+        for old in segments[:-self.backup_count]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Flush buffered records, stop the flush thread and finish compression."""
+        self._stop_event.set()
+        with self.lock:
+            self._write_buffer()
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+        self._compressor.shutdown(wait=True)
+        super().close()
+
+# Overflow policies understood by BoundedQueueHandler
+OVERFLOW_POLICIES = ('block', 'drop_oldest', 'drop_debug')
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a bounded queue with a configurable overflow policy.
+
+    Producers only enqueue records; a QueueListener drains them into the
+    real sinks on a background thread. When the queue is full the policy
+    decides what happens:
+
+    - ``block``: wait for the listener to make room (no records lost)
+    - ``drop_oldest``: evict the oldest queued record to make room
+    - ``drop_debug``: drop incoming DEBUG records, block for INFO and above
+
+    Args:
+        log_queue: Bounded queue shared with the QueueListener
+        overflow_policy: One of OVERFLOW_POLICIES (default: 'block')
+
+    Raises:
+        ValueError: If overflow_policy is not one of OVERFLOW_POLICIES
+    """
+
+    def __init__(self, log_queue: queue.Queue, overflow_policy: str = 'block'):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow_policy must be one of {OVERFLOW_POLICIES}, got {overflow_policy!r}")
+        super().__init__(log_queue)
+        self.overflow_policy = overflow_policy
+        self.dropped: Dict[str, int] = {}
+        self._dropped_lock = threading.Lock()
+
+    def _count_drop(self, record: logging.LogRecord) -> None:
+        with self._dropped_lock:
+            self.dropped[record.levelname] = self.dropped.get(record.levelname, 0) + 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Merge the arguments into the message of a copy of the record.
+
+        Unlike QueueHandler.prepare, the traceback is not folded into the
+        message: it is kept as ``exc_text``, which text sinks append as
+        usual and structured sinks write as their ``exc`` field.
+        """
+        record = copy.copy(record)
+        record.message = record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            # Tracebacks hold frames, which must not outlive the call or cross the queue
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord, wait: bool = True) -> None:
+        """
+        Queue a record, applying the overflow policy if the queue is full.
+
+        Args:
+            record: Prepared record
+            wait: False never waits for room: where the policy would block,
+                the oldest queued record is evicted instead (default: True)
+        """
+        if self.overflow_policy == 'block' and wait:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if self.overflow_policy == 'drop_debug':
+            if record.levelno <= logging.DEBUG:
+                self._count_drop(record)
+                return
+            if wait:
+                self.queue.put(record)
+                return
+        # drop_oldest: evict until the new record fits
+        while True:
+            try:
+                evicted = self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                self.queue.task_done()
+                if evicted is logging.handlers.QueueListener._sentinel:
+                    # Shutdown raced with this record: keep the listener's stop signal, drop the record
+                    self.queue.put(evicted)
+                    self._count_drop(record)
+                    return
+                self._count_drop(evicted)
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                continue
+
+class _SummaryState(threading.local):
+    # True while a filter emits a "suppressed N" summary on this thread
+    emitting = False
+
+_summary_state = _SummaryState()
+
+class _VolumeFilter(logging.Filter):
+    """
+    Base class for the log volume filters.
+
+    Records above max_level always pass. One instance may be attached to
+    several handlers: the verdict for a record is computed once and reused
+    for the other handlers, so a record is counted (and dropped) only once.
+    Summary records emitted by any volume filter bypass all of them.
+    """
+    kind = ''
+
+    def __init__(self, max_level: int):
+        super().__init__()
+        self.max_level = max_level
+        self.dropped: Dict[str, int] = {}
+        self._dropped_lock = threading.Lock()
+        self._last = threading.local()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or _summary_state.emitting:
+            return True
+        last = self._last
+        if getattr(last, 'record', None) is record:
+            return last.verdict
+        verdict = self._decide(record)
+        if not verdict:
+            with self._dropped_lock:
+                self.dropped[record.levelname] = self.dropped.get(record.levelname, 0) + 1
+        last.record, last.verdict = record, verdict
+        return verdict
+
+    def _decide(self, record: logging.LogRecord) -> bool:
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Emit pending "suppressed N" summaries now (no-op for filters without summaries)."""
+
+    @staticmethod
+    def _emit_summary(name: str, level: int, source: Optional[logging.LogRecord], msg: str, *args: Any) -> None:
+        """Log a summary record on the named logger, past every volume filter."""
+        summary_logger = logging.getLogger(name)
+        pathname, lineno, func = (source.pathname, source.lineno, source.funcName) if source else ('', 0, None)
+        record = summary_logger.makeRecord(name, level, pathname, lineno, msg, args, None, func=func)
+        _summary_state.emitting = True
+        try:
+            summary_logger.handle(record)
+        finally:
+            _summary_state.emitting = False
+
+class SamplingFilter(_VolumeFilter):
+    """
+    Filter keeping a random fraction of the records of each logger.
+
+    Rates are looked up by logger name prefix, like logger levels: a rate
+    for ``demo_sub_app`` applies to ``demo_sub_app.example_module2`` unless
+    that name has its own rate. The empty name sets the default; loggers
+    without a matching prefix keep every record.
+
+    Args:
+        rates: Keep probability (0.0-1.0) per logger name prefix
+        max_level: Records above this level are never sampled (default: INFO)
+        seed: Seed for the random generator, for reproducible sampling (default: None)
+
+    Raises:
+        ValueError: If a rate is outside 0.0-1.0
+
+    Example:
+        >>> handler.addFilter(SamplingFilter({'': 1.0, 'demo_sub_app.example_module2.ExampleClass': 0.01}))
+        >>> # Keeps 1% of ExampleClass INFO/DEBUG records, everything else
+    """
+    kind = 'sampling'
+
+    def __init__(self, rates: Dict[str, float], max_level: int = logging.INFO, seed: Optional[int] = None):
+        super().__init__(max_level)
+        for name, rate in rates.items():
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"Sample rate for {name!r} must be between 0.0 and 1.0, got {rate}")
+        import random
+        self.rates = dict(rates)
+        self._random = random.Random(seed).random
+        self._resolved: Dict[str, float] = {}
+
+    def rate_for(self, name: str) -> float:
+        """Return the keep probability for a logger name."""
+        rate = self._resolved.get(name)
+        if rate is None:
+            prefix = name
+            while prefix and prefix not in self.rates:
+                prefix = prefix.rpartition('.')[0]
+            rate = self._resolved[name] = self.rates.get(prefix, 1.0)
+        return rate
+
+    def _decide(self, record: logging.LogRecord) -> bool:
+        rate = self.rate_for(record.name)
+        return rate >= 1.0 or self._random() < rate
+
+class RateLimitFilter(_VolumeFilter):
+    """
+    Token-bucket filter limiting the records per second of each logger.
+
+    Each logger (or all loggers together, with per_logger=False) gets a
+    bucket of ``burst`` tokens refilled at ``rate`` tokens per second; a
+    record passes if it can take a token. While records are being dropped,
+    a WARNING "Rate limit suppressed N records" summary is logged before a
+    passing record, at most once per ``summary_interval`` seconds per
+    bucket. Timing uses ``record.created``, so no clock is read.
+
+    Args:
+        rate: Sustained records per second
+        burst: Records allowed at once after a quiet period (default: max(1, rate))
+        per_logger: One bucket per logger name instead of one shared bucket (default: True)
+        max_level: Records above this level are never limited (default: INFO)
+        summary_interval: Minimum seconds between summaries of one bucket (default: 10.0)
+
+    Raises:
+        ValueError: If rate is not positive or burst < 1
+
+    Example:
+        >>> handler.addFilter(RateLimitFilter(rate=50, burst=200))
+    """
+    kind = 'rate_limit'
+
+    def __init__(self, rate: float, burst: Optional[int] = None, per_logger: bool = True,
+                 max_level: int = logging.INFO, summary_interval: float = 10.0):
+        super().__init__(max_level)
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        burst = max(1, int(rate)) if burst is None else burst
+        if burst < 1:
+            raise ValueError(f"burst must be >= 1, got {burst}")
+        self.rate = rate
+        self.burst = burst
+        self.per_logger = per_logger
+        self.summary_interval = summary_interval
+        # Bucket key -> [tokens, last refill time, suppressed records, last summary time]
+        self._buckets: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def _decide(self, record: logging.LogRecord) -> bool:
+        key = record.name if self.per_logger else ''
+        now = record.created
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(self.burst), now, 0, now]
+            else:
+                bucket[0] = min(float(self.burst), bucket[0] + max(0.0, now - bucket[1]) * self.rate)
+                bucket[1] = now
+            if bucket[0] < 1.0:
+                bucket[2] += 1
+                return False
+            bucket[0] -= 1.0
+            suppressed = 0
+            if bucket[2] and now - bucket[3] >= self.summary_interval:
+                suppressed, bucket[2], bucket[3] = bucket[2], 0, now
+        if suppressed:
+            self._emit_rate_summary(key, suppressed)
+        return True
+
+    def _emit_rate_summary(self, key: str, suppressed: int) -> None:
+        self._emit_summary(key or __name__, logging.WARNING, None,
+                           "Rate limit suppressed %d records from %s (limit %g/s)",
+                           suppressed, key or 'all loggers', self.rate)
+
+    def flush(self) -> None:
+        with self._lock:
+            pending = [(key, bucket[2]) for key, bucket in self._buckets.items() if bucket[2]]
+            for key, _ in pending:
+                self._buckets[key][2] = 0
+                self._buckets[key][3] = time.time()
+        for key, suppressed in pending:
+            self._emit_rate_summary(key, suppressed)
+
+class DeduplicationFilter(_VolumeFilter):
+    """
+    Filter dropping repeats of an identical message within a time window.
+
+    A message is identified by logger name, level and formatted text. The
+    first occurrence passes and opens a window of ``window`` seconds during
+    which repeats are dropped and counted. Once the window has closed, a
+    "Suppressed N identical messages" summary is logged on the original
+    logger, at the original level, before the next record passes the
+    filter (or when flush() is called).
 
-def setup_development_logging(level: int = logging.INFO, include_timestamp: bool = True) -> None:
+    Args:
+        window: Seconds during which repeats of a message are dropped
+        max_level: Records above this level are never deduplicated (default: WARNING)
+        max_keys: Distinct messages tracked at once; the oldest are closed
+            early beyond this (default: 10000)
+
+    Raises:
+        ValueError: If window is not positive or max_keys < 1
+
+    Example:
+        >>> handler.addFilter(DeduplicationFilter(window=60))
+    """
+    kind = 'dedup'
+
+    def __init__(self, window: float, max_level: int = logging.WARNING, max_keys: int = 10000):
+        super().__init__(max_level)
+        if window <= 0:
+            raise ValueError(f"window must be positive, got {window}")
+        if max_keys < 1:
+            raise ValueError(f"max_keys must be >= 1, got {max_keys}")
+        self.window = window
+        self.max_keys = max_keys
+        # (name, levelno, message) -> [window start, suppressed repeats, first record], oldest window first
+        self._seen: "OrderedDict[tuple, list]" = OrderedDict()
+        self._next_sweep = 0.0
+        self._lock = threading.Lock()
+
+    def _close_windows(self, now: float) -> list:
+        # Caller holds self._lock; returns the closed entries that need a summary
+        closed = []
+        while self._seen:
+            entry = next(iter(self._seen.values()))
+            if now - entry[0] < self.window:
+                break
+            self._seen.popitem(last=False)
+            if entry[1]:
+                closed.append(entry)
+        # Nothing else can close before the oldest remaining window does
+        self._next_sweep = (entry[0] if self._seen else now) + self.window
+        return closed
+
+    def _decide(self, record: logging.LogRecord) -> bool:
+        now = record.created
+        key = (record.name, record.levelno, record.getMessage())
+        with self._lock:
+            pending = self._close_windows(now) if now >= self._next_sweep else []
+            entry = self._seen.get(key)
+            if entry is not None and now - entry[0] < self.window:
+                entry[1] += 1
+                verdict = False
+            else:
+                if entry is not None:
+                    del self._seen[key]
+                    if entry[1]:
+                        pending.append(entry)
+                elif len(self._seen) >= self.max_keys:
+                    # Close the oldest window early to stay within max_keys
+                    evicted = self._seen.popitem(last=False)[1]
+                    if evicted[1]:
+                        pending.append(evicted)
+                self._seen[key] = [now, 0, record]
+                verdict = True
+        for entry in pending:
+            self._emit_dedup_summary(entry)
+        return verdict
+
+    def _emit_dedup_summary(self, entry: list) -> None:
+        first = entry[2]
+        self._emit_summary(first.name, first.levelno, first, "Suppressed %d identical messages within %gs: %s",
+                           entry[1], self.window, first.getMessage())
+
+    def flush(self) -> None:
+        with self._lock:
+            pending = [entry for entry in self._seen.values() if entry[1]]
+            self._seen.clear()
+        for entry in pending:
+            self._emit_dedup_summary(entry)
+
+class _BoundLogContext:
+    """Immutable set of context fields; renders its text form once, on first use."""
+    __slots__ = ('fields', '_text')
+
+    def __init__(self, fields: Dict[str, Any]):
+        self.fields = fields
+        self._text = None if fields else ''
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = '[' + ' '.join(f'{key}={value}' for key, value in self.fields.items()) + '] '
+        return self._text
+
+_EMPTY_LOG_CONTEXT = _BoundLogContext({})
+_log_context: contextvars.ContextVar = contextvars.ContextVar('log_context', default=_EMPTY_LOG_CONTEXT)
+
+# Text format used by the setup functions; %(log_context)s is '' when nothing is bound
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(log_context)s%(message)s'
+
+def bind_log_context(**fields: Any) -> contextvars.Token:
+    """
+    Add fields to the log context of the current thread or asyncio task.
+
+    Every record handled by a LogContextFilter while the fields are bound
+    carries them: as attributes (so JSON and binary output include them like
+    ``extra`` fields) and rendered as ``[key=value ...]`` in text output.
+    Binding copies the current fields once; nothing is allocated per log call.
+    asyncio tasks, offload() calls and non-blocking log records inherit the
+    context of the code that created them.
+
+    Args:
+        **fields: Context fields, e.g. ``request_id='r-1', tenant_id='acme'``;
+            they replace fields of the same name
+
+    Returns:
+        contextvars.Token: Pass to reset_log_context to restore the previous fields
+
+    Raises:
+        ValueError: If a field name clashes with a LogRecord attribute
+
+    Example:
+        >>> token = bind_log_context(request_id="r-1")
+        >>> logger.info("Handled")   # ... - INFO - [request_id=r-1] Handled
+        >>> reset_log_context(token)
+    """
+    reserved = _RECORD_ATTRS.intersection(fields)
+    if reserved:
+        raise ValueError(f"Log context fields clash with LogRecord attributes: {sorted(reserved)}")
+    current = _log_context.get().fields
+    return _log_context.set(_BoundLogContext({**current, **fields}))
+
+def reset_log_context(token: contextvars.Token) -> None:
+    """Restore the log context that was current before bind_log_context returned token."""
+    _log_context.reset(token)
+
+def get_log_context() -> Dict[str, Any]:
+    """Return a copy of the fields bound in the current thread or asyncio task."""
+    return dict(_log_context.get().fields)
+
+class log_context:
+    """
+    Context manager binding log context fields for the duration of a block.
+
+    Args:
+        **fields: Context fields, as for bind_log_context
+
+    Example:
+        >>> with log_context(request_id="r-1", tenant_id="acme"):
+        ...     process_text("Hello world")   # its records carry both IDs
+    """
+    __slots__ = ('fields', '_token')
+
+    def __init__(self, **fields: Any):
+        self.fields = fields
+        self._token = None
+
+    def __enter__(self) -> "log_context":
+        self._token = bind_log_context(**self.fields)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _log_context.reset(self._token)
+
+class LogContextFilter(logging.Filter):
+    """
+    Filter copying the bound log context onto every record it sees.
+
+    Sets ``record.log_context`` (the ``%(log_context)s`` text, empty when
+    nothing is bound) and one attribute per context field; ``extra`` fields
+    passed to the log call win over context fields of the same name. Must
+    run on the logging thread, i.e. on the first handler a record reaches;
+    the setup functions install it there. Never drops records.
+
+    Example:
+        >>> handler = logging.StreamHandler()
+        >>> handler.addFilter(LogContextFilter())
+        >>> handler.setFormatter(logging.Formatter(TEXT_FORMAT, defaults={'log_context': ''}))
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record_dict = record.__dict__
+        if 'log_context' in record_dict:
+            # Already set by the filter of an earlier handler
+            return True
+        context = _log_context.get()
+        record_dict['log_context'] = context
+        for key, value in context.fields.items():
+            record_dict.setdefault(key, value)
+        return True
+
+def _text_formatter(fmt: str = TEXT_FORMAT) -> logging.Formatter:
+    """Return a text formatter that also accepts records no LogContextFilter has seen."""
+    return logging.Formatter(fmt, defaults={'log_context': ''})
+
+# Volume filters installed by setup_production_logging
+_log_filters: list = []
+
+def get_filtered_log_counts() -> Dict[str, Dict[str, int]]:
+    """
+    Get the number of records dropped by the volume filters, per filter and level.
+
+    Returns:
+        Dict[str, Dict[str, int]]: Drop counters keyed by filter kind
+        ('dedup', 'sampling', 'rate_limit') and level name (empty when
+        setup_production_logging installed no filters)
+    """
+    counts = {}
+    for log_filter in _log_filters:
+        with log_filter._dropped_lock:
+            counts[log_filter.kind] = dict(log_filter.dropped)
+    return counts
+
+def flush_log_filters() -> None:
+    """
+    Emit the pending "suppressed N" summaries of the installed volume filters.
+
+    Registered with atexit by setup_production_logging when filters are used.
+    """
+    for log_filter in list(_log_filters):
+        log_filter.flush()
+
+def _remove_log_filters() -> None:
+    """Flush and forget the filters of a previous setup_production_logging call."""
+    flush_log_filters()
+    _log_filters.clear()
+
+class _BlockingSentinelListener(logging.handlers.QueueListener):
+    """QueueListener whose shutdown sentinel waits for room in a full queue."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+# Active async logging pipeline, if any: (queue handler, listener)
+_async_pipeline: Optional[tuple] = None
+_async_pipeline_lock = threading.Lock()
+
+def get_dropped_log_counts() -> Dict[str, int]:
+    """
+    Get the number of records dropped by the async logging queue, per level.
+
+    Returns:
+        Dict[str, int]: Snapshot of drop counters keyed by level name
+        (empty when async mode is off or nothing was dropped)
+    """
+    pipeline = _async_pipeline
+    if pipeline is None:
+        return {}
+    queue_handler = pipeline[0]
+    with queue_handler._dropped_lock:
+        return dict(queue_handler.dropped)
+
+def shutdown_async_logging() -> None:
+    """
+    Stop the async logging listener after flushing every queued record.
+
+    Safe to call more than once; registered with atexit by
+    setup_production_logging(async_mode=True).
+    """
+    global _async_pipeline
+    with _async_pipeline_lock:
+        pipeline, _async_pipeline = _async_pipeline, None
+    if pipeline is None:
+        return
+    queue_handler, listener = pipeline
+    dropped = dict(queue_handler.dropped)
+    if dropped:
+        logger.warning("Async logging dropped records: %s", dropped)
+    logging.getLogger().removeHandler(queue_handler)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+        handler.close()
+
+def setup_development_logging(level: int = logging.INFO, include_timestamp: bool = True,
+                              output_format: str = 'text') -> None:
     """
     Setup logging configuration for development/testing environments.
     
     Args:
         level: Logging level (default: logging.INFO)
         include_timestamp: Whether to include timestamp in log format
+        output_format: 'text' for human-readable lines or 'json' for one JSON
+            object per line (default: 'text')
         
     Returns:
         None
         
+    Raises:
+        ValueError: If output_format is not 'text' or 'json'
+        
     Example:
         >>> setup_development_logging(level=logging.DEBUG)
         >>> # Now all loggers will output to console with DEBUG level
     """
-    format_str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s' if include_timestamp else '%(name)s - %(levelname)s - %(message)s'
+    if output_format not in ('text', 'json'):
+        raise ValueError(f"output_format must be 'text' or 'json' for console logging, got {output_format!r}")
+    
+    # Flush and stop a production async listener before replacing root handlers
+    shutdown_async_logging()
+    _remove_log_filters()
+    
+    format_str = TEXT_FORMAT if include_timestamp else '%(name)s - %(levelname)s - %(log_context)s%(message)s'
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(JsonFormatter() if output_format == 'json' else _text_formatter(format_str))
+    console_handler.addFilter(LogContextFilter())
     
     logging.basicConfig(
         level=level,
-        format=format_str,
-        handlers=[logging.StreamHandler()],
+        handlers=[console_handler],
         force=True
     )
     
@@ -95,39 +1239,150 @@ def setup_development_logging(level: int = logging.INFO, include_timestamp: bool
     logging.getLogger('urllib3').setLevel(logging.ERROR)
     logging.getLogger('requests').setLevel(logging.WARNING)
     
-    logger.info(f"Development logging configured at {logging.getLevelName(level)} level")
+    logger.info("Development logging configured at %s level", logging.getLevelName(level))
 
-def setup_production_logging(log_file_path: Union[str, Path], level: int = logging.INFO) -> None:
+def setup_production_logging(log_file_path: Union[str, Path], level: int = logging.INFO,
+                             async_mode: bool = False, queue_size: int = 10000,
+                             overflow_policy: str = 'block', batched: bool = False,
+                             batch_size: int = 100, flush_interval_ms: int = 1000,
+                             max_bytes: int = 0, rotate_interval: float = 0,
+                             backup_count: int = 0, compress: bool = False,
+                             output_format: str = 'text', sample_rates: Optional[Dict[str, float]] = None,
+                             rate_limit: float = 0, rate_limit_burst: Optional[int] = None,
+                             dedup_window: float = 0) -> None:
     """
     Setup logging configuration for production environments.
     
     Args:
         log_file_path: Path to log file (str or Path object)
         level: Logging level (default: logging.INFO)
+        async_mode: Enqueue records through a QueueHandler and write them to
+            the file and console on a background QueueListener (default: False)
+        queue_size: Maximum number of queued records in async mode (default: 10000)
+        overflow_policy: What to do when the queue is full: 'block',
+            'drop_oldest' or 'drop_debug' (default: 'block')
+        batched: Write the file through a BatchedRotatingFileHandler instead
+            of a plain FileHandler (default: False)
+        batch_size: Records per batched write (default: 100)
+        flush_interval_ms: Maximum delay before buffered records are written (default: 1000)
+        max_bytes: Rotate the file at this size, 0 disables (default: 0)
+        rotate_interval: Rotate the file every N seconds, 0 disables (default: 0)
+        backup_count: Rotated segments to keep, 0 keeps all (default: 0)
+        compress: Gzip rotated segments on a background thread (default: False)
+        output_format: 'text', 'json' (one JSON object per line) or 'binary'
+            (length-prefixed msgpack records in the file, JSON on the console;
+            read back with read_binary_log) (default: 'text')
+        sample_rates: Keep probability per logger name prefix for INFO and
+            DEBUG records, e.g. ``{'demo_sub_app': 0.1}``; see SamplingFilter
+            (default: None, keep everything)
+        rate_limit: Maximum INFO/DEBUG records per second per logger, 0
+            disables; see RateLimitFilter (default: 0)
+        rate_limit_burst: Records a logger may emit at once after a quiet
+            period (default: None, one second's worth)
+        dedup_window: Drop repeats of an identical WARNING-or-lower message
+            for this many seconds, 0 disables; see DeduplicationFilter (default: 0)
         
     Returns:
         None
         
+    Raises:
+        ValueError: If overflow_policy or output_format is not a known value,
+            or a sample rate, rate_limit or dedup_window is out of range
+        
     Example:
         >>> setup_production_logging("/var/log/app/service.log")
         >>> # Logs will go to both file and console
+        >>> setup_production_logging("/var/log/app/service.log", async_mode=True,
+        ...                          overflow_policy="drop_debug")
+        >>> # Callers only enqueue; call shutdown_async_logging() to flush
+        >>> setup_production_logging("/var/log/app/service.log", batched=True,
+        ...                          max_bytes=100 * 1024 * 1024, backup_count=10, compress=True)
+        >>> # Batched writes, size-based rotation, gzipped segments
+        >>> setup_production_logging("/var/log/app/service.log", output_format="json")
+        >>> # {"ts":1700000000.1,"level":"INFO","logger":"app","msg":"..."} per line
+        >>> setup_production_logging("/var/log/app/service.log", dedup_window=60, rate_limit=100,
+        ...                          sample_rates={'demo_sub_app.example_module2.ExampleClass': 0.01})
+        >>> # Repeats collapsed into "Suppressed N" lines, at most 100 records/s per logger,
+        >>> # 1% of ExampleClass INFO records; warnings and errors are never sampled or limited
     """
-    import sys
+    if overflow_policy not in OVERFLOW_POLICIES:
+        raise ValueError(f"overflow_policy must be one of {OVERFLOW_POLICIES}, got {overflow_policy!r}")
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"output_format must be one of {OUTPUT_FORMATS}, got {output_format!r}")
+    
+    # Deduplicate first so repeats spend no sampling draws or rate-limit tokens
+    log_filters = []
+    if dedup_window:
+        log_filters.append(DeduplicationFilter(dedup_window))
+    if sample_rates:
+        log_filters.append(SamplingFilter(sample_rates))
+    if rate_limit:
+        log_filters.append(RateLimitFilter(rate_limit, rate_limit_burst))
     
     # Ensure log directory exists
     log_path = Path(log_file_path)
     log_path.parent.mkdir(parents=True, exist_ok=True)
     
+    # Flush and stop a listener left over from a previous configuration
+    shutdown_async_logging()
+    _remove_log_filters()
+    
+    if output_format == 'text':
+        file_formatter = console_formatter = _text_formatter()
+    else:
+        console_formatter = JsonFormatter()
+        file_formatter = BinaryFormatter() if output_format == 'binary' else console_formatter
+    
+    if batched:
+        file_handler = BatchedRotatingFileHandler(
+            log_path, batch_size=batch_size, flush_interval_ms=flush_interval_ms,
+            max_bytes=max_bytes, rotate_interval=rotate_interval,
+            backup_count=backup_count, compress=compress
+        )
+    elif output_format == 'binary':
+        file_handler = BinaryLogHandler(log_path)
+    else:
+        file_handler = logging.FileHandler(log_path)
+    console_handler = logging.StreamHandler(sys.stdout)
+    file_handler.setFormatter(file_formatter)
+    console_handler.setFormatter(console_formatter)
+    sinks = [file_handler, console_handler]
+    
+    if async_mode:
+        queue_handler = BoundedQueueHandler(queue.Queue(maxsize=queue_size), overflow_policy)
+        listener = _BlockingSentinelListener(queue_handler.queue, *sinks, respect_handler_level=True)
+        handlers = [queue_handler]
+    else:
+        handlers = sinks
+    
+    # Filter at the first handler a record reaches: dropped records are never queued or formatted,
+    # and the log context is read on the thread that logged the record
+    context_filter = LogContextFilter()
+    for handler in handlers:
+        for log_filter in log_filters:
+            handler.addFilter(log_filter)
+        handler.addFilter(context_filter)
+    
     logging.basicConfig(
         level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_path),
-            logging.StreamHandler(sys.stdout)
-        ],
+        handlers=handlers,
         force=True
     )
     
+    if async_mode:
+        global _async_pipeline
+        with _async_pipeline_lock:
+            _async_pipeline = (queue_handler, listener)
+        listener.start()
+        atexit.unregister(shutdown_async_logging)
+        atexit.register(shutdown_async_logging)
+    
+    if log_filters:
+        _log_filters.extend(log_filters)
+        # Registered last so it runs first at exit, while the async listener still drains
+        atexit.unregister(flush_log_filters)
+        atexit.register(flush_log_filters)
+    
     # Your package modules - operational level
     logging.getLogger('new_python_repo').setLevel(level)
     
@@ -135,7 +1390,13 @@ def setup_production_logging(log_file_path: Union[str, Path], level: int = loggi
     for lib in ['sqlalchemy', 'urllib3', 'requests', 'boto3', 'botocore', 'streamlit']:
         logging.getLogger(lib).setLevel(logging.WARNING)
     
-    logger.info(f"Production logging configured: {log_path}")
+    if async_mode:
+        logger.info("Production logging configured: %s (async, queue_size=%d, overflow_policy=%s)",
+                    log_path, queue_size, overflow_policy)
+    else:
+        logger.info("Production logging configured: %s", log_path)
+    if log_filters:
+        logger.info("Log volume filters: %s", ", ".join(log_filter.kind for log_filter in log_filters))
 
 if __name__ == "__main__":
     import sys
@@ -179,4 +1440,93 @@ if __name__ == "__main__":
     result3 = TestClass.test_classmethod()
     print(f"Test 3: {result3}")
     
+    # Test frame-free resolution matches set_logger_w_obj_name naming
+    class CachedClass:
+        logger = ObjLogger()
+        method_logger = ObjLogger("run")
+
+        def run(self):
+            return set_logger_w_obj_name()
+
+    @obj_logger
+    def cached_function():
+        return set_logger_w_obj_name()
+
+    cached_obj = CachedClass()
+    assert cached_obj.method_logger is cached_obj.run()
+    assert cached_function.logger is cached_function()
+    assert cached_obj.logger.name == f"{__name__}.CachedClass"
+    print(f"Test 4: cached loggers match ({_resolve_obj_logger.cache_info()})")
+    
+    import timeit
+    frame_time = timeit.timeit(cached_obj.run, number=100_000)
+    descriptor_time = timeit.timeit(lambda: cached_obj.method_logger, number=100_000)
+    print(f"Test 5: set_logger_w_obj_name {frame_time * 10:.3f} us/call, "
+          f"ObjLogger {descriptor_time * 10:.3f} us/call")
+    clear_obj_logger_cache()
+    
+    # Test async production logging with a tiny queue to force overflow
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_file = Path(tmp_dir) / "async.log"
+        setup_production_logging(log_file, level=logging.DEBUG, async_mode=True,
+                                 queue_size=8, overflow_policy='drop_debug')
+        for i in range(1000):
+            logger.debug("Queued debug record %d", i)
+        dropped = get_dropped_log_counts()
+        shutdown_async_logging()
+        print(f"Test 6: async logging wrote {len(log_file.read_text().splitlines())} lines, dropped {dropped}")
+        
+        # Test structured binary output round trip
+        binary_file = Path(tmp_dir) / "service.logbin"
+        setup_production_logging(binary_file, output_format='binary')
+        logger.info("Structured record %d", 7, extra={'request_id': 'req-42'})
+        records = list(read_binary_log(binary_file))
+        print(f"Test 7: binary log round trip -> {records[-1]}")
+        
+        setup_development_logging(level=logging.DEBUG, output_format='json')
+        logger.info("Test 8: JSON console record", extra={'request_id': 'req-43'})
+
+        # Test volume filters: repeats collapse, sampled and rate-limited loggers thin out
+        filtered_file = Path(tmp_dir) / "filtered.log"
+        setup_production_logging(filtered_file, dedup_window=60, rate_limit=100, rate_limit_burst=100,
+                                 sample_rates={'volume.sampled': 0.1})
+        for i in range(1000):
+            logging.getLogger('volume.repeated').info("Same message")
+            logging.getLogger('volume.sampled').info("Sampled record %d", i)
+            logging.getLogger('volume.limited').info("Limited record %d", i)
+        logging.getLogger('volume.limited').warning("Warnings are never limited")
+        counts = get_filtered_log_counts()
+        flush_log_filters()
+        lines = filtered_file.read_text().splitlines()
+        print(f"Test 9: volume filters wrote {len(lines)} of 3001 records, dropped {counts}")
+        print(f"        {[line for line in lines if 'Suppressed' in line][0]}")
+
+        # Test log context: concurrent asyncio tasks keep their own request IDs in text and JSON output
+        import asyncio
+        import json
+
+        async def handle_request(request_id):
+            with log_context(request_id=request_id, tenant_id="acme"):
+                await asyncio.sleep(0)
+                logging.getLogger('context.demo').info("Handled %s", request_id)
+
+        async def handle_requests():
+            await asyncio.gather(*(handle_request(f"req-{i}") for i in range(3)))
+
+        for output_format in ('text', 'json'):
+            context_file = Path(tmp_dir) / f"context.{output_format}.log"
+            setup_production_logging(context_file, output_format=output_format)
+            asyncio.run(handle_requests())
+            lines = [line for line in context_file.read_text().splitlines() if 'Handled' in line]
+            for line in lines:
+                if output_format == 'json':
+                    record = json.loads(line)
+                    assert record['msg'] == f"Handled {record['request_id']}"
+                else:
+                    assert f"[request_id={line.rsplit(' ', 1)[1]} tenant_id=acme] Handled" in line
+            print(f"Test 10: {output_format} context -> {lines[0]}")
+        assert get_log_context() == {}
+    
+    setup_development_logging(level=logging.DEBUG)
     print("Logging utilities testing completed")
\ No newline at end of file
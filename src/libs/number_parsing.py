@@ -0,0 +1,202 @@
+"""Vectorized parsing of delimited number lists.
+
+Parsing pasted input with ``[float(x.strip()) for x in text.split(',')]``
+creates a Python string and a Python float per value before anything is
+summed. This module parses the encoded text directly into a float64 NumPy
+array with ``np.fromstring``, one block of tokens at a time, and records
+the positions of malformed tokens while doing so, so the result can be
+handed to ``calculate_sum`` without conversion.
+
+Features:
+    - Block-wise vectorized parsing into a single preallocated float64 array
+    - Malformed and empty tokens reported by position and text
+    - Only blocks containing malformed tokens are bisected to locate them
+
+Example:
+    >>> from libs.number_parsing import parse_numbers
+    >>> parsed = parse_numbers("1, 2.5, x, 4")
+    >>> parsed.values
+    array([1. , 2.5, 4. ])
+    >>> parsed.malformed_positions.tolist(), parsed.malformed_tokens
+    ([2], ('x',))
+"""
+
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+
+# Configure module-level logger - NO handlers, NO setLevel
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Approximate bytes handed to one np.fromstring call; a malformed token only costs re-parsing its block
+NUMBER_PARSE_BLOCK = 1 << 20
+
+@dataclass(frozen=True)
+class ParsedNumbers:
+    """Result of parse_numbers.
+
+    Attributes:
+        values: float64 array of the well-formed values, in input order
+        malformed_positions: int64 array of the 0-based token positions that
+            could not be parsed (empty when all tokens are valid)
+        malformed_tokens: Stripped text of each malformed token, aligned with
+            malformed_positions
+    """
+    values: np.ndarray
+    malformed_positions: np.ndarray
+    malformed_tokens: tuple
+
+    @property
+    def ok(self) -> bool:
+        """True if every token was a valid number."""
+        return self.malformed_positions.size == 0
+
+    @property
+    def token_count(self) -> int:
+        """Number of tokens in the input, valid or not."""
+        return self.values.size + self.malformed_positions.size
+
+def _token_bounds(block: bytes, sep: bytes) -> tuple:
+    """Return (starts, ends) byte offsets of the tokens in a block."""
+    seps = np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == sep[0])
+    return np.concatenate(([0], seps + 1)), np.concatenate((seps, [len(block)]))
+
+def _parse_block(block: bytes, sep: bytes, first: int, count: int, out: np.ndarray, malformed: dict) -> None:
+    """Parse the count tokens of a block into out[first:first + count], recording malformed tokens.
+
+    np.fromstring parses a blank token as -1.0 instead of failing, so tokens
+    that parsed to -1.0 (or NaN) are checked for content; everything else is
+    only looked at again if the block as a whole fails to parse.
+    """
+    bounds = None
+    try:
+        values = np.fromstring(block, dtype=np.float64, sep=sep.decode())
+    except ValueError:
+        values = None
+
+    if values is not None and values.size == count:
+        out[first:first + count] = values
+        suspects = np.flatnonzero((values == -1.0) | np.isnan(values))
+        if suspects.size:
+            starts, ends = bounds = _token_bounds(block, sep)
+            for i in suspects.tolist():
+                if not block[starts[i]:ends[i]].strip():
+                    malformed[first + i] = ''
+        return
+
+    # A trailing separator parses without error but yields one value too few
+    starts, ends = bounds or _token_bounds(block, sep)
+    if count == 1:
+        token = block.strip().decode('utf-8', 'replace')
+        # float() also accepts syntax np.fromstring rejects, e.g. '1_000' and non-ASCII digits
+        try:
+            out[first] = float(token)
+        except ValueError:
+            malformed[first] = token
+        return
+    mid = count // 2
+    _parse_block(block[:ends[mid - 1]], sep, first, mid, out, malformed)
+    _parse_block(block[starts[mid]:], sep, first + mid, count - mid, out, malformed)
+
+def parse_numbers(text: str, sep: str = ',') -> ParsedNumbers:
+    """Parse separator-delimited numbers into a float64 array in one vectorized pass.
+
+    Tokens may be surrounded by whitespace and use any syntax ``float()``
+    accepts (e.g. ``1e3``, ``-inf``, ``nan``, ``1_000``, full-width digits).
+    Most are parsed by ``np.fromstring``; the few tokens it rejects are
+    retried with ``float()`` before being reported as malformed. Empty or
+    blank tokens count as malformed, like ``float('')`` would. Blank or empty
+    text yields no tokens.
+
+    Args:
+        text: Text holding the numbers
+        sep: Single non-whitespace ASCII separator character (default: ',')
+
+    Returns:
+        ParsedNumbers with the valid values and the malformed token positions
+
+    Raises:
+        TypeError: If text is not a string
+        ValueError: If sep is not a single non-whitespace ASCII character
+
+    Example:
+        >>> parse_numbers("1,2,3").values
+        array([1., 2., 3.])
+        >>> parse_numbers("1,,3").malformed_positions
+        array([1])
+    """
+    if not isinstance(text, str):
+        raise TypeError("Input must be a string of numbers")
+    if len(sep) != 1 or not sep.isascii() or sep.isspace():
+        raise ValueError(f"sep must be a single non-whitespace ASCII character, got {sep!r}")
+
+    data = text.encode('utf-8')
+    if not data.strip():
+        return ParsedNumbers(np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64), ())
+
+    sep_bytes = sep.encode()
+    out = np.empty(data.count(sep_bytes) + 1, dtype=np.float64)
+    malformed = {}
+    pos = index = 0
+    while pos <= len(data):
+        # Cut blocks at a separator so no token is split between two blocks
+        cut = data.find(sep_bytes, pos + NUMBER_PARSE_BLOCK)
+        if cut == -1:
+            cut = len(data)
+        block = data[pos:cut]
+        count = block.count(sep_bytes) + 1
+        _parse_block(block, sep_bytes, index, count, out, malformed)
+        index += count
+        pos = cut + 1
+
+    if malformed:
+        positions = np.array(sorted(malformed), dtype=np.int64)
+        tokens = tuple(malformed[i] for i in positions.tolist())
+        out = np.delete(out, positions)
+        logger.warning("Parsed %d numbers, %d malformed tokens (first at position %d)",
+                       out.size, positions.size, positions[0])
+    else:
+        positions = np.empty(0, dtype=np.int64)
+        tokens = ()
+        logger.debug("Parsed %d numbers", out.size)
+    return ParsedNumbers(out, positions, tokens)
+
+if __name__ == "__main__":
+    import time
+
+    logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    print("Testing number_parsing functions...")
+
+    # Test 1: Valid input with whitespace and float syntax variants
+    parsed = parse_numbers(" 1, 2.5 ,-3e2,\t.5 ")
+    print(f"Test 1 Result: values={parsed.values.tolist()}, ok={parsed.ok}")
+
+    # Test 2: Malformed and empty tokens are reported by position
+    parsed = parse_numbers("1,abc,3,,5, ,7,8x,")
+    print(f"Test 2 Result: values={parsed.values.tolist()}, malformed={parsed.malformed_positions.tolist()}, "
+          f"tokens={parsed.malformed_tokens}")
+
+    # Test 2b: Tokens only float() understands are still numbers
+    parsed = parse_numbers("1_000, \uff11\uff12, 3")
+    print(f"Test 2b Result: values={parsed.values.tolist()}, ok={parsed.ok}")
+
+    # Test 3: Blank input has no tokens
+    print(f"Test 3 Result: blank input token_count={parse_numbers('   ').token_count}")
+
+    # Test 4: Large input matches the per-token parser
+    rng = np.random.default_rng(0)
+    expected = rng.uniform(-1e6, 1e6, 1_000_000)
+    text = ", ".join(f"{v:.6f}" for v in expected)
+    start = time.perf_counter()
+    parsed = parse_numbers(text)
+    vectorized = time.perf_counter() - start
+    start = time.perf_counter()
+    reference = [float(x.strip()) for x in text.split(',')]
+    per_token = time.perf_counter() - start
+    match = np.array_equal(parsed.values, np.array(reference))
+    print(f"Test 4 Result: 1e6 values match={match}, parse_numbers {vectorized:.3f}s vs per-token {per_token:.3f}s")
+
+    print("Module testing completed")